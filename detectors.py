@@ -3,11 +3,30 @@
 Wireless device detectors for different platforms and device types
 """
 
+import asyncio
+import functools
+import logging
+import os
 import platform
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# The platform never changes at runtime, resolve it once
+_PLATFORM = platform.system()
+
+# Absolute paths of the external tools we use, None when not installed
+_CMD = {name: shutil.which(name) for name in (
+    'bluetoothctl', 'iwconfig', 'lsusb', 'system_profiler', 'netsh', 'networksetup', 'ip')}
 
 # Platform-specific imports
 try:
@@ -25,7 +44,7 @@ except ImportError:
     usb = None
 
 # Windows-specific imports
-if platform.system() == "Windows":
+if _PLATFORM == "Windows":
     try:
         import wmi
         import win32com.client
@@ -36,26 +55,500 @@ if platform.system() == "Windows":
         pythoncom = None
 
 # Linux/Unix-specific imports
-if platform.system() in ["Linux", "Darwin"]:
+if _PLATFORM in ["Linux", "Darwin"]:
     try:
         import bluetooth
     except ImportError:
         bluetooth = None
 
+# Linux hotplug notifications
+if _PLATFORM == "Linux":
+    try:
+        import pyudev
+    except ImportError:
+        pyudev = None
+
 from models import WirelessDevice, DeviceType, DeviceStatus
 
+# Keyword patterns, compiled once so each name is scanned in a single pass
+_DONGLE_RE = re.compile(r'receiver|dongle|unifying')
+_WIFI_RE = re.compile(r'wifi|wireless lan|802\.11|wlan')
+_BLUETOOTH_RE = re.compile(r'bluetooth')
+_AUDIO_RE = re.compile(r'audio|headset|speaker|microphone')
+_WIRELESS_TERMS_RE = re.compile(r'wireless|wifi|bluetooth|dongle')
+_WIRELESS_PORT_RE = re.compile(r'wi-fi|wireless')
+_WIRELESS_IFACE_RE = re.compile(r'wlan|wifi|wl|ath|ra|wireless')
+
+# Linux exposes every network interface here; wireless ones have a wireless/ or phy80211 entry
+_SYSFS_NET = '/sys/class/net'
+_IFF_UP = 0x1
+
+# iwconfig prints about ten lines per interface, stop reading runaway output
+_IWCONFIG_MAX_LINES = 1000
+
+# Command output parsers, each extracting every field of a record in one match
+# Both queries go to one interactive bluetoothctl session
+_BLUETOOTHCTL_SCRIPT = b'list\npaired-devices\nquit\n'
+# Colour codes, readline markers and "[bluetooth]# " prompts in interactive output
+_BLUETOOTHCTL_NOISE_RE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]|[\x01\x02]')
+_BLUETOOTHCTL_PROMPT_RE = re.compile(r'^(?:\[[^\]\n]*\][#>] ?)+', re.MULTILINE)
+# "Controller" lines only come from list, "Device" lines only from paired-devices;
+# event lines such as "[NEW] Device ..." keep their prefix and don't match
+_BLUETOOTHCTL_RE = re.compile(
+    r'^\s*(?P<kind>Controller|Device)\s+(?P<mac>[0-9A-Fa-f:]{17})\s+(?P<name>.+?)\s*$', re.MULTILINE)
+# "Powered: yes" / "Connected: no" lines from bluetoothctl show/info
+_BLUETOOTHCTL_FLAG_RE = re.compile(r'^\s*(Powered|Paired|Connected):\s*(yes|no)\s*$', re.MULTILINE)
+_LSUSB_RE = re.compile(
+    r'^Bus (?P<bus>\d+) Device (?P<dev>\d+): ID (?P<vid>[0-9a-fA-F]{4}):(?P<pid>[0-9a-fA-F]{4}) ?(?P<desc>.*?)\s*$',
+    re.MULTILINE)
+_SP_USB_RE = re.compile(
+    r'^\s*(?:(?P<name>[^:\n]+):|Product ID: (?P<pid>\S+)|Vendor ID: (?P<vid>[^\n]+?))\s*$', re.MULTILINE)
+
+# Enumeration results per detector, keyed by "<detector class>:<platform>"
+_enum_cache: Dict[str, Tuple[float, List[WirelessDevice]]] = {}
+
+# Per-thread COM state; a WMI connection is only valid in the apartment that created it
+_com_state = threading.local()
+
+# Narrow WQL queries so WMI filters server-side instead of returning every PnP entity
+_WQL_BLUETOOTH = ("SELECT Name, DeviceID, Manufacturer, Status FROM Win32_PnPEntity "
+                  "WHERE PNPClass='Bluetooth' OR Service='BTHUSB'")
+_WQL_USB = "SELECT Name FROM Win32_PnPEntity WHERE PNPDeviceID LIKE 'USB%'"
+
+def _get_wmi():
+    """Return this thread's WMI connection, initializing COM once per thread"""
+    if getattr(_com_state, 'wmi', None) is None:
+        if not getattr(_com_state, 'com_initialized', False):
+            pythoncom.CoInitialize()
+            _com_state.com_initialized = True
+        _com_state.wmi = wmi.WMI()
+    return _com_state.wmi
+
+def _reset_wmi():
+    """Forget this thread's WMI connection so the next call rebinds it"""
+    _com_state.wmi = None
+
+def _enum_cache_key(detector) -> str:
+    return f"{detector.__class__.__name__}:{_PLATFORM}"
+
+def ttl_cache(seconds: float = 5.0):
+    """Cache a detector's enumeration coroutine for the given number of seconds"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self) -> List[WirelessDevice]:
+            key = _enum_cache_key(self)
+            cached = _enum_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < seconds:
+                return list(cached[1])
+            
+            devices = await func(self)
+            _enum_cache[key] = (time.monotonic(), devices)
+            return list(devices)
+        return wrapper
+    return decorator
+
+# Smoothed (EWMA) wall time of each command line, in seconds
+_command_latency: Dict[Tuple[str, ...], float] = {}
+_LATENCY_SMOOTHING = 0.3
+
+def _adaptive_timeout(command: Tuple[str, ...], default: float) -> float:
+    """Timeout for a command: three times its usual latency, capped at the default"""
+    latency = _command_latency.get(command)
+    if latency is None:
+        return default
+    return min(default, max(0.5, 3 * latency))
+
+def _record_latency(command: Tuple[str, ...], elapsed: float):
+    latency = _command_latency.get(command)
+    if latency is None:
+        _command_latency[command] = elapsed
+    else:
+        _command_latency[command] = latency + _LATENCY_SMOOTHING * (elapsed - latency)
+
+# Upper bound on how long a hotplug-cached enumeration is served: pairing,
+# connection and power changes don't produce udev add/remove events
+_HOTPLUG_CACHE_TTL = 15.0
+
+def hotplug_cached(func):
+    """Serve the last enumeration until udev reports a device change
+    
+    Only active for detectors that started a udev watch; otherwise every
+    call goes through to the wrapped coroutine. Entries also expire after
+    _HOTPLUG_CACHE_TTL, and empty results are never kept since they are
+    usually a failed or timed-out query.
+    """
+    @functools.wraps(func)
+    async def wrapper(self) -> List[WirelessDevice]:
+        if self._udev_observer is None:
+            return await func(self)
+        
+        cached = self._device_cache
+        if cached is not None and time.monotonic() - cached[0] < _HOTPLUG_CACHE_TTL:
+            return list(cached[1])
+        
+        generation = self._hotplug_generation
+        devices = await func(self)
+        # Don't keep a result that raced with a hotplug event
+        if devices and generation == self._hotplug_generation:
+            self._device_cache = (time.monotonic(), devices)
+        else:
+            self._device_cache = None
+        return list(devices)
+    return wrapper
+
+async def _no_devices() -> List[WirelessDevice]:
+    return []
+
+async def _run_command(*args: str, timeout: float = 5, adaptive: bool = False,
+                       input: Optional[bytes] = None) -> Optional[str]:
+    """Run an external command and return its stdout, or None on a non-zero exit
+    
+    With adaptive=True the timeout shrinks to fit the command's observed latency,
+    with the given timeout as the upper bound. input is fed to the command's stdin.
+    """
+    if adaptive:
+        timeout = _adaptive_timeout(args, timeout)
+    
+    started = time.monotonic()
+    proc = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        stdin=asyncio.subprocess.PIPE if input is not None else None)
+    try:
+        stdout, _ = await asyncio.wait_for(proc.communicate(input), timeout=timeout)
+    except asyncio.CancelledError:
+        # Service shutdown; don't leave the child running
+        proc.kill()
+        raise
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        # Count the timeout as a slow sample so the next attempt gets more time
+        _record_latency(args, timeout)
+        raise
+    
+    _record_latency(args, time.monotonic() - started)
+    if proc.returncode != 0:
+        return None
+    return stdout.decode(errors='replace')
+
+# pyusb backend, probed once and shared by every detector that walks the USB bus
+_usb_backend = None
+_usb_backend_probed = False
+
+# Last usb.core.find() result as (monotonic timestamp, devices)
+_usb_snapshot: Tuple[float, list] = (0.0, [])
+_usb_snapshot_lock = threading.Lock()
+_USB_SNAPSHOT_TTL = 5.0
+
+# USB class codes of a Bluetooth radio: Wireless Controller / RF Controller
+_USB_CLASS_WIRELESS_CONTROLLER = 0xE0
+_USB_SUBCLASS_RF_CONTROLLER = 0x01
+
+# Device classes that identify a wireless device on their own: HID (keyboards/mice),
+# Hub and Wireless Controller
+_USB_DEVICE_CLASS_WIRELESS = frozenset({3, 9, _USB_CLASS_WIRELESS_CONTROLLER})
+# Device classes whose function lives in the interface descriptors: 0 (per-interface)
+# and 0xEF (Miscellaneous / Interface Association composites)
+_USB_DEVICE_CLASS_COMPOSITE = frozenset({0, 0xEF})
+
+# Device classes worth keeping in the snapshot; must cover everything
+# USBWirelessDetector._check_device_classes can accept
+_SNAPSHOT_DEVICE_CLASSES = _USB_DEVICE_CLASS_WIRELESS | _USB_DEVICE_CLASS_COMPOSITE
+
+def _get_usb_backend():
+    """Return the first available pyusb backend, or None"""
+    global _usb_backend, _usb_backend_probed
+    if _usb_backend_probed or not usb:
+        return _usb_backend
+    _usb_backend_probed = True
+    
+    # Try different backends in order of preference
+    backends = [
+        usb.backend.libusb1.get_backend,
+        usb.backend.libusb0.get_backend,
+        usb.backend.openusb.get_backend,
+    ]
+    
+    for get_backend in backends:
+        try:
+            backend = get_backend()
+            if backend is not None:
+                _usb_backend = backend
+                logger.info("Using USB backend: %s", backend.__class__.__name__)
+                break
+        except Exception as e:
+            continue
+    
+    if _usb_backend is None:
+        logger.warning("No USB backend available. USB device detection will be limited.")
+    
+    return _usb_backend
+
+def _shared_usb_snapshot() -> list:
+    """Enumerate the USB bus once and share the device list for a few seconds"""
+    global _usb_snapshot
+    with _usb_snapshot_lock:
+        taken, devices = _usb_snapshot
+        if time.monotonic() - taken >= _USB_SNAPSHOT_TTL:
+            devices = list(usb.core.find(find_all=True, backend=_get_usb_backend(),
+                                         custom_match=_is_wireless_candidate))
+            _usb_snapshot = (time.monotonic(), devices)
+        return devices
+
+def _is_wireless_candidate(device) -> bool:
+    """Cheap descriptor-field filter applied while pyusb enumerates the bus"""
+    return (device.idVendor in USBWirelessDetector._WIRELESS_VIDS or
+            device.bDeviceClass in _SNAPSHOT_DEVICE_CLASSES)
+
+def _invalidate_usb_snapshot():
+    global _usb_snapshot
+    with _usb_snapshot_lock:
+        _usb_snapshot = (0.0, [])
+
+# Longest a synchronous caller waits on a detector coroutine
+_SERVICE_RUN_TIMEOUT = 30.0
+# Longest DetectorService.close() waits for pending coroutines to unwind
+_SERVICE_CLOSE_TIMEOUT = 3.0
+
+class DetectorService:
+    """Long-lived event loop shared by all detectors
+    
+    The loop runs in a daemon thread so synchronous callers (the device
+    manager, GUI worker threads) can submit detector coroutines from any
+    thread without paying for a fresh loop per scan. Blocking library calls
+    go to a small thread pool; pyusb gets a dedicated single thread because
+    libusb handles are not safe to share across threads.
+    """
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    def __init__(self, max_workers: int = 3):
+        self._loop = asyncio.new_event_loop()
+        self._exec = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='airmon-blocking')
+        self._usb_exec = ThreadPoolExecutor(max_workers=1, thread_name_prefix='airmon-usb')
+        self._thread = threading.Thread(target=self._loop.run_forever, name='airmon-detectors', daemon=True)
+        self._thread.start()
+    
+    @classmethod
+    def instance(cls) -> 'DetectorService':
+        """Return the process-wide service, starting it on first use"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    @classmethod
+    def shutdown(cls):
+        """Close the process-wide service if it was ever started"""
+        with cls._instance_lock:
+            service = cls._instance
+        if service is not None:
+            service.close()
+    
+    def run(self, coro, timeout: float = _SERVICE_RUN_TIMEOUT):
+        """Run a coroutine on the service loop and wait for its result"""
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("DetectorService.run() called from its own event loop")
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError:
+            future.cancel()
+            raise
+    
+    async def run_blocking(self, func, *args):
+        """Run a blocking call (WMI, psutil) in the worker pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._exec, func, *args)
+    
+    async def run_usb(self, func, *args):
+        """Run a pyusb call on the dedicated USB thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._usb_exec, func, *args)
+    
+    def close(self):
+        """Cancel pending detector coroutines, then stop the loop and its worker threads"""
+        # Callers blocked in run() only return once their coroutine finishes
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_pending(), self._loop).result(_SERVICE_CLOSE_TIMEOUT)
+        except Exception as e:
+            logger.warning("Detector tasks did not finish cancelling: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=1.0)
+        self._exec.shutdown(wait=False)
+        self._usb_exec.shutdown(wait=False)
+        with DetectorService._instance_lock:
+            if DetectorService._instance is self:
+                DetectorService._instance = None
+    
+    @staticmethod
+    async def _cancel_pending():
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+# How long _CommandStream waits for a terminated child to go away
+_STREAM_EXIT_TIMEOUT = 1.0
+_HAS_KILLPG = hasattr(os, 'killpg')
+
+class _CommandStream:
+    """Async context manager that yields a command's stdout line by line
+    
+    Parsers can stop reading as soon as they have what they need; the child
+    is terminated on exit instead of buffering the rest of its output.
+    """
+    
+    def __init__(self, *args: str, timeout: float = 5, adaptive: bool = False,
+                 max_lines: Optional[int] = None):
+        self._args = args
+        self._timeout = _adaptive_timeout(args, timeout) if adaptive else timeout
+        self._max_lines = max_lines
+        self._lines_read = 0
+        self._proc = None
+        self._started = 0.0
+        self._deadline = 0.0
+    
+    async def __aenter__(self):
+        self._started = time.monotonic()
+        self._deadline = self._started + self._timeout
+        # Own process group, so an early exit can also stop helpers the command spawned
+        self._proc = await asyncio.create_subprocess_exec(
+            *self._args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL,
+            start_new_session=_HAS_KILLPG)
+        return self
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self) -> str:
+        if self._max_lines is not None and self._lines_read >= self._max_lines:
+            raise StopAsyncIteration
+        
+        try:
+            line = await asyncio.wait_for(self._proc.stdout.readline(),
+                                          self._deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            _record_latency(self._args, self._timeout)
+            raise
+        
+        if not line:
+            _record_latency(self._args, time.monotonic() - self._started)
+            raise StopAsyncIteration
+        
+        self._lines_read += 1
+        return line.decode(errors='replace')
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        proc = self._proc
+        if proc.returncode is None:
+            self._signal(signal.SIGTERM)
+        
+        # wait() only returns once stdout reached EOF, and a child blocked on a
+        # full pipe never exits, so keep discarding its output until it is gone
+        if not await self._drain():
+            self._signal(signal.SIGKILL if _HAS_KILLPG else signal.SIGTERM)
+            await self._drain()
+        
+        try:
+            await asyncio.wait_for(proc.wait(), _STREAM_EXIT_TIMEOUT)
+        except asyncio.TimeoutError:
+            logger.debug("%s did not exit after being stopped", self._args[0])
+    
+    def _signal(self, sig):
+        """Signal the command's whole process group where supported, else just the child"""
+        try:
+            if _HAS_KILLPG:
+                os.killpg(self._proc.pid, sig)
+            else:
+                self._proc.send_signal(sig)
+        except (ProcessLookupError, PermissionError):
+            pass  # Already gone
+    
+    async def _drain(self) -> bool:
+        """Read and drop stdout until EOF; False if that took too long"""
+        try:
+            await asyncio.wait_for(self._discard_stdout(), _STREAM_EXIT_TIMEOUT)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _discard_stdout(self):
+        while await self._proc.stdout.read(65536):
+            pass
+
 class WirelessDetector(ABC):
     """Abstract base class for wireless device detectors"""
     
-    @abstractmethod
+    # Device types this detector can enable and disable
+    managed_types: FrozenSet[DeviceType] = frozenset()
+    
+    # Hotplug state, only used once _watch_hotplug() succeeded
+    _udev_observer = None
+    _device_cache: Optional[Tuple[float, List[WirelessDevice]]] = None
+    _hotplug_generation = 0
+    
     def detect_devices(self) -> List[WirelessDevice]:
         """Detect and return list of wireless devices"""
-        pass
+        return DetectorService.instance().run(self.detect_devices_async())
     
     @abstractmethod
+    async def detect_devices_async(self) -> List[WirelessDevice]:
+        """Coroutine that detects and returns list of wireless devices"""
+        pass
+    
+    def refresh(self):
+        """Drop cached enumeration results so the next scan hits the hardware"""
+        _enum_cache.pop(_enum_cache_key(self), None)
+        self._device_cache = None
+    
+    def refresh_device(self, device: WirelessDevice) -> Optional[DeviceStatus]:
+        """Re-query a single device and return its current status, or None if not found"""
+        return DetectorService.instance().run(self.refresh_device_async(device))
+    
+    async def refresh_device_async(self, device: WirelessDevice) -> Optional[DeviceStatus]:
+        """Rescan this detector only and pick the device out by type, interface and MAC or name"""
+        self.refresh()
+        identity = device.mac_address or device.name
+        for found in await self.detect_devices_async():
+            if (found.device_type == device.device_type and found.interface == device.interface and
+                    (found.mac_address or found.name) == identity):
+                return found.status
+        return None
+    
+    def close(self):
+        """Stop background watchers"""
+        if self._udev_observer is not None:
+            self._udev_observer.stop()
+            self._udev_observer = None
+    
+    def _watch_hotplug(self, *subsystems: str):
+        """Follow udev add/remove events for the given subsystems (Linux with pyudev only)"""
+        if _PLATFORM != "Linux" or not pyudev:
+            return
+        
+        try:
+            context = pyudev.Context()
+            monitor = pyudev.Monitor.from_netlink(context)
+            for subsystem in subsystems:
+                monitor.filter_by(subsystem)
+            
+            observer = pyudev.MonitorObserver(monitor, callback=self._on_hotplug_event,
+                                              name=f"{self.__class__.__name__}-udev")
+            observer.daemon = True
+            observer.start()
+            self._udev_observer = observer
+        except Exception as e:
+            logger.warning("Could not start udev monitor, falling back to polling: %s", e)
+    
+    def _on_hotplug_event(self, device):
+        if device.action in ('add', 'remove'):
+            self._hotplug_generation += 1
+            self.refresh()
+    
     def can_manage_device(self, device: WirelessDevice) -> bool:
         """Check if the detector can manage the given device"""
-        pass
+        return device.device_type in self.managed_types
     
     @abstractmethod
     def enable_device(self, device: WirelessDevice) -> bool:
@@ -70,15 +563,46 @@ class WirelessDetector(ABC):
 class BluetoothDetector(WirelessDetector):
     """Bluetooth device detector"""
     
-    def detect_devices(self) -> List[WirelessDevice]:
+    managed_types = frozenset({DeviceType.BLUETOOTH})
+    
+    def __init__(self):
+        # WMI is a blocking COM API, keep it off the event loop
+        self._detect_platform_bluetooth = {
+            "Windows": lambda: DetectorService.instance().run_blocking(self._detect_windows_bluetooth),
+            "Linux": self._detect_linux_bluetooth,
+            "Darwin": self._detect_macos_bluetooth,
+        }.get(_PLATFORM, _no_devices)
+        self._watch_hotplug('usb', 'bluetooth')
+    
+    @hotplug_cached
+    @ttl_cache(seconds=5)
+    async def detect_devices_async(self) -> List[WirelessDevice]:
+        devices = await self._detect_platform_bluetooth()
+        
+        if not devices and usb and _get_usb_backend() is not None:
+            # No platform tooling answered, look for Bluetooth radios on the USB bus
+            devices.extend(await DetectorService.instance().run_usb(self._detect_usb_bluetooth_adapters))
+        
+        return devices
+    
+    def _detect_usb_bluetooth_adapters(self) -> List[WirelessDevice]:
+        """Find Bluetooth adapters in the shared USB bus snapshot"""
         devices = []
         
-        if platform.system() == "Windows":
-            devices.extend(self._detect_windows_bluetooth())
-        elif platform.system() == "Linux":
-            devices.extend(self._detect_linux_bluetooth())
-        elif platform.system() == "Darwin":
-            devices.extend(self._detect_macos_bluetooth())
+        try:
+            for device in _shared_usb_snapshot():
+                if (device.bDeviceClass == _USB_CLASS_WIRELESS_CONTROLLER and
+                        device.bDeviceSubClass == _USB_SUBCLASS_RF_CONTROLLER):
+                    devices.append(WirelessDevice(
+                        name=f"Bluetooth Adapter {device.idVendor:04x}:{device.idProduct:04x}",
+                        device_type=DeviceType.BLUETOOTH,
+                        interface=f"USB (Bus {device.bus}, Device {device.address})",
+                        vendor_id=f"{device.idVendor:04x}",
+                        product_id=f"{device.idProduct:04x}",
+                        status=DeviceStatus.CONNECTED
+                    ))
+        except Exception as e:
+            logger.warning("Error detecting USB Bluetooth adapters: %s", e)
         
         return devices
     
@@ -88,13 +612,10 @@ class BluetoothDetector(WirelessDetector):
             return devices
         
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            
-            c = wmi.WMI()
+            c = _get_wmi()
             # Get Bluetooth devices
-            for device in c.Win32_PnPEntity():
-                if device.Name and "bluetooth" in device.Name.lower():
+            for device in c.query(_WQL_BLUETOOTH):
+                if device.Name:
                     status = DeviceStatus.ENABLED if device.Status == "OK" else DeviceStatus.DISABLED
                     devices.append(WirelessDevice(
                         name=device.Name,
@@ -107,70 +628,57 @@ class BluetoothDetector(WirelessDetector):
                         }
                     ))
         except Exception as e:
-            print(f"Error detecting Windows Bluetooth devices: {e}")
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            logger.warning("Error detecting Windows Bluetooth devices: %s", e)
+            _reset_wmi()
         
         return devices
     
-    def _detect_linux_bluetooth(self) -> List[WirelessDevice]:
+    async def _detect_linux_bluetooth(self) -> List[WirelessDevice]:
         devices = []
+        if not _CMD['bluetoothctl']:
+            return devices
         
         try:
-            # Try using bluetoothctl command
-            result = subprocess.run(['bluetoothctl', 'list'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.strip().startswith('Controller'):
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            mac = parts[1]
-                            name = ' '.join(parts[2:])
-                            devices.append(WirelessDevice(
-                                name=name,
-                                device_type=DeviceType.BLUETOOTH,
-                                interface="Bluetooth Controller",
-                                mac_address=mac,
-                                status=DeviceStatus.ENABLED
-                            ))
-            
-            # Try to get paired devices
-            result = subprocess.run(['bluetoothctl', 'paired-devices'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.strip().startswith('Device'):
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            mac = parts[1]
-                            name = ' '.join(parts[2:])
-                            devices.append(WirelessDevice(
-                                name=name,
-                                device_type=DeviceType.BLUETOOTH,
-                                interface="Bluetooth Device",
-                                mac_address=mac,
-                                status=DeviceStatus.PAIRED
-                            ))
+            # Controllers and paired devices from a single session (one fork, one D-Bus connection)
+            output = await _run_command(_CMD['bluetoothctl'], input=_BLUETOOTHCTL_SCRIPT)
+            if output is not None:
+                output = _BLUETOOTHCTL_NOISE_RE.sub('', output)
+                output = _BLUETOOTHCTL_PROMPT_RE.sub('', output)
+                
+                for m in _BLUETOOTHCTL_RE.finditer(output):
+                    if m.group('kind') == 'Controller':
+                        devices.append(WirelessDevice(
+                            name=m.group('name'),
+                            device_type=DeviceType.BLUETOOTH,
+                            interface="Bluetooth Controller",
+                            mac_address=m.group('mac'),
+                            status=DeviceStatus.ENABLED
+                        ))
+                    else:
+                        devices.append(WirelessDevice(
+                            name=m.group('name'),
+                            device_type=DeviceType.BLUETOOTH,
+                            interface="Bluetooth Device",
+                            mac_address=m.group('mac'),
+                            status=DeviceStatus.PAIRED
+                        ))
         
         except Exception as e:
-            print(f"Error detecting Linux Bluetooth devices: {e}")
+            logger.warning("Error detecting Linux Bluetooth devices: %s", e)
         
         return devices
     
-    def _detect_macos_bluetooth(self) -> List[WirelessDevice]:
+    async def _detect_macos_bluetooth(self) -> List[WirelessDevice]:
         devices = []
+        if not _CMD['system_profiler']:
+            return devices
         
         try:
             # Use system_profiler to get Bluetooth info
-            result = subprocess.run(['system_profiler', 'SPBluetoothDataType'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
+            output = await _run_command(_CMD['system_profiler'], 'SPBluetoothDataType', timeout=10, adaptive=True)
+            if output is not None:
                 # Parse the output (simplified parsing)
-                lines = result.stdout.split('\n')
+                lines = output.split('\n')
                 for i, line in enumerate(lines):
                     if 'Address:' in line:
                         mac = line.split(':')[1].strip()
@@ -190,20 +698,39 @@ class BluetoothDetector(WirelessDetector):
                         ))
         
         except Exception as e:
-            print(f"Error detecting macOS Bluetooth devices: {e}")
+            logger.warning("Error detecting macOS Bluetooth devices: %s", e)
         
         return devices
     
-    def can_manage_device(self, device: WirelessDevice) -> bool:
-        return device.device_type == DeviceType.BLUETOOTH
+    async def refresh_device_async(self, device: WirelessDevice) -> Optional[DeviceStatus]:
+        if _PLATFORM != "Linux" or not _CMD['bluetoothctl'] or not device.mac_address:
+            return await super().refresh_device_async(device)
+        
+        # Ask BlueZ about this one address instead of listing everything
+        controller = device.interface == "Bluetooth Controller"
+        try:
+            output = await _run_command(_CMD['bluetoothctl'], 'show' if controller else 'info',
+                                        device.mac_address)
+        except Exception as e:
+            logger.warning("Error querying Bluetooth device %s: %s", device.mac_address, e)
+            return None
+        if output is None:
+            return None
+        
+        flags = dict(_BLUETOOTHCTL_FLAG_RE.findall(output))
+        if controller:
+            return DeviceStatus.ENABLED if flags.get('Powered') == 'yes' else DeviceStatus.DISABLED
+        if flags.get('Connected') == 'yes':
+            return DeviceStatus.CONNECTED
+        return DeviceStatus.PAIRED if flags.get('Paired') == 'yes' else DeviceStatus.DISCONNECTED
     
     def enable_device(self, device: WirelessDevice) -> bool:
         # Implementation would depend on platform and specific device
         # This is a simplified version
         try:
-            if platform.system() == "Linux":
-                subprocess.run(['bluetoothctl', 'power', 'on'], 
-                             capture_output=True, timeout=5)
+            if _PLATFORM == "Linux" and _CMD['bluetoothctl']:
+                subprocess.run([_CMD['bluetoothctl'], 'power', 'on'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return True
         except Exception:
             pass
@@ -211,9 +738,9 @@ class BluetoothDetector(WirelessDetector):
     
     def disable_device(self, device: WirelessDevice) -> bool:
         try:
-            if platform.system() == "Linux":
-                subprocess.run(['bluetoothctl', 'power', 'off'], 
-                             capture_output=True, timeout=5)
+            if _PLATFORM == "Linux" and _CMD['bluetoothctl']:
+                subprocess.run([_CMD['bluetoothctl'], 'power', 'off'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return True
         except Exception:
             pass
@@ -222,6 +749,8 @@ class BluetoothDetector(WirelessDetector):
 class USBWirelessDetector(WirelessDetector):
     """USB-based wireless device detector (dongles, adapters)"""
     
+    managed_types = frozenset({DeviceType.RF_DONGLE, DeviceType.WIFI_ADAPTER})
+    
     # Known wireless device vendor IDs
     WIRELESS_VENDORS = {
         0x046d: "Logitech",  # Logitech wireless devices
@@ -234,71 +763,68 @@ class USBWirelessDetector(WirelessDetector):
         0x8087: "Intel",     # Intel wireless adapters
     }
     
+    _WIRELESS_VIDS = frozenset(WIRELESS_VENDORS)
+    _DEVICE_CLASS_WIRELESS = _USB_DEVICE_CLASS_WIRELESS
+    _DEVICE_CLASS_COMPOSITE = _USB_DEVICE_CLASS_COMPOSITE
+    # Interface classes: 3 is HID, 224 (0xE0) is Wireless Controller
+    _INTF_CLASS_WIRELESS = frozenset({3, 224})
+    
+    # Product strings per (idVendor, idProduct), shared by all instances
+    _product_name_cache: Dict[Tuple[int, int], str] = {}
+    
     def __init__(self):
         self.backend = None
+        # WirelessDevice per (idVendor, idProduct, bus, address)
+        self._device_info_cache: Dict[tuple, WirelessDevice] = {}
+        # Descriptor-walk verdicts per (bus, address, idVendor, idProduct)
+        self._wireless_check_cache: Dict[tuple, bool] = {}
+        self._detect_platform_fallback = {
+            "Windows": lambda: DetectorService.instance().run_blocking(self._detect_windows_usb_fallback),
+            "Linux": self._detect_linux_usb_fallback,
+            "Darwin": self._detect_macos_usb_fallback,
+        }.get(_PLATFORM, _no_devices)
         self._initialize_backend()
+        self._watch_hotplug('usb')
     
     def _initialize_backend(self):
         """Initialize USB backend"""
-        if not usb:
-            return
-        
-        # Try different backends in order of preference
-        backends = [
-            usb.backend.libusb1.get_backend,
-            usb.backend.libusb0.get_backend,
-            usb.backend.openusb.get_backend,
-        ]
-        
-        for get_backend in backends:
-            try:
-                backend = get_backend()
-                if backend is not None:
-                    self.backend = backend
-                    print(f"Using USB backend: {backend.__class__.__name__}")
-                    break
-            except Exception as e:
-                continue
-        
-        if self.backend is None:
-            print("No USB backend available. USB device detection will be limited.")
+        self.backend = _get_usb_backend()
     
-    def detect_devices(self) -> List[WirelessDevice]:
-        devices = []
-        
+    @hotplug_cached
+    @ttl_cache(seconds=5)
+    async def detect_devices_async(self) -> List[WirelessDevice]:
         if not usb or self.backend is None:
             # Fallback to system commands
-            return self._detect_devices_fallback()
+            return await self._detect_devices_fallback()
         
         try:
-            # Find USB devices using the backend
-            usb_devices = usb.core.find(find_all=True, backend=self.backend)
-            
-            for device in usb_devices:
-                if self._is_wireless_device(device):
-                    device_info = self._get_device_info(device)
-                    devices.append(device_info)
-        
+            # pyusb walks the bus synchronously, keep it off the event loop
+            return await DetectorService.instance().run_usb(self._detect_pyusb_devices)
         except Exception as e:
-            print(f"Error detecting USB wireless devices: {e}")
+            logger.warning("Error detecting USB wireless devices: %s", e)
             # Try fallback method
-            return self._detect_devices_fallback()
+            return await self._detect_devices_fallback()
+    
+    def _detect_pyusb_devices(self) -> List[WirelessDevice]:
+        """Enumerate wireless devices through the pyusb backend"""
+        devices = []
+        
+        # The bus snapshot is shared with BluetoothDetector
+        for device in _shared_usb_snapshot():
+            if self._is_wireless_device(device):
+                device_info = self._get_device_info(device)
+                devices.append(device_info)
         
         return devices
     
-    def _detect_devices_fallback(self) -> List[WirelessDevice]:
+    async def _detect_devices_fallback(self) -> List[WirelessDevice]:
         """Fallback method using system commands"""
         devices = []
         
         try:
-            if platform.system() == "Windows":
-                devices.extend(self._detect_windows_usb_fallback())
-            elif platform.system() == "Linux":
-                devices.extend(self._detect_linux_usb_fallback())
-            elif platform.system() == "Darwin":
-                devices.extend(self._detect_macos_usb_fallback())
+            devices.extend(await self._detect_platform_fallback())
         except Exception as e:
-            print(f"Error in USB fallback detection: {e}")
+            logger.warning("Error in USB fallback detection: %s", e)
         
         return devices
     
@@ -309,88 +835,84 @@ class USBWirelessDetector(WirelessDetector):
             return devices
         
         try:
-            pythoncom.CoInitialize()
-            c = wmi.WMI()
+            c = _get_wmi()
             
-            for device in c.Win32_USBControllerDevice():
-                dependent = device.Dependent
-                if dependent and hasattr(dependent, 'Name'):
-                    name = dependent.Name
-                    if name and any(term in name.lower() for term in ['wireless', 'wifi', 'bluetooth', 'dongle']):
-                        devices.append(WirelessDevice(
-                            name=name,
-                            device_type=self._classify_device_by_name(name),
-                            interface="USB",
-                            status=DeviceStatus.CONNECTED,
-                            additional_info={"detection_method": "WMI"}
-                        ))
+            for device in c.query(_WQL_USB):
+                name = device.Name
+                if not name:
+                    continue
+                name_lower = name.lower()
+                if _WIRELESS_TERMS_RE.search(name_lower):
+                    devices.append(WirelessDevice(
+                        name=name,
+                        device_type=self._classify_device_by_name(name, name_lower),
+                        interface="USB",
+                        status=DeviceStatus.CONNECTED
+                    ))
         except Exception as e:
-            print(f"Windows USB fallback error: {e}")
-        finally:
-            try:
-                pythoncom.CoUninitialize()
-            except:
-                pass
+            logger.warning("Windows USB fallback error: %s", e)
+            _reset_wmi()
         
         return devices
     
-    def _detect_linux_usb_fallback(self) -> List[WirelessDevice]:
+    async def _detect_linux_usb_fallback(self) -> List[WirelessDevice]:
         """Linux USB detection using lsusb"""
         devices = []
+        if not _CMD['lsusb']:
+            return devices
         
         try:
-            result = subprocess.run(['lsusb'], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                for line in result.stdout.split('\n'):
-                    if line.strip():
-                        # Parse lsusb output
-                        parts = line.split()
-                        if len(parts) >= 6:
-                            device_info = ' '.join(parts[6:])
-                            if any(term in device_info.lower() for term in ['wireless', 'wifi', 'bluetooth', 'dongle']):
-                                # Extract vendor:product ID
-                                id_part = parts[5]  # Format: vendor_id:product_id
-                                vendor_id, product_id = id_part.split(':')
-                                
-                                devices.append(WirelessDevice(
-                                    name=device_info,
-                                    device_type=self._classify_device_by_name(device_info),
-                                    interface=f"USB (Bus {parts[1]}, Device {parts[3].rstrip(':')})",
-                                    vendor_id=vendor_id,
-                                    product_id=product_id,
-                                    status=DeviceStatus.CONNECTED,
-                                    additional_info={"detection_method": "lsusb"}
-                                ))
+            output = await _run_command(_CMD['lsusb'], timeout=10)
+            if output is not None:
+                # Format: Bus 001 Device 002: ID vendor_id:product_id description
+                for m in _LSUSB_RE.finditer(output):
+                    device_info = m.group('desc')
+                    device_info_lc = device_info.lower()
+                    if _WIRELESS_TERMS_RE.search(device_info_lc):
+                        devices.append(WirelessDevice(
+                            name=device_info,
+                            device_type=self._classify_device_by_name(device_info, device_info_lc),
+                            interface=f"USB (Bus {m.group('bus')}, Device {m.group('dev')})",
+                            vendor_id=m.group('vid'),
+                            product_id=m.group('pid'),
+                            status=DeviceStatus.CONNECTED
+                        ))
         except Exception as e:
-            print(f"Linux USB fallback error: {e}")
+            logger.warning("Linux USB fallback error: %s", e)
         
         return devices
     
-    def _detect_macos_usb_fallback(self) -> List[WirelessDevice]:
+    async def _detect_macos_usb_fallback(self) -> List[WirelessDevice]:
         """macOS USB detection using system_profiler"""
         devices = []
+        if not _CMD['system_profiler']:
+            return devices
         
         try:
-            result = subprocess.run(['system_profiler', 'SPUSBDataType'], 
-                                  capture_output=True, text=True, timeout=15)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
+            async with _CommandStream(_CMD['system_profiler'], 'SPUSBDataType',
+                                      timeout=15, adaptive=True) as lines:
                 current_device = None
                 
-                for line in lines:
-                    line = line.strip()
-                    if line.endswith(':') and not line.startswith(' '):
-                        # This is a device name
-                        device_name = line[:-1]
-                        if any(term in device_name.lower() for term in ['wireless', 'wifi', 'bluetooth', 'dongle']):
+                async for line in lines:
+                    # Only device headers and ID lines match, everything else is skipped
+                    m = _SP_USB_RE.match(line)
+                    if m is None:
+                        continue
+                    
+                    device_name = m.group('name')
+                    if device_name is not None:
+                        # A new device block starts here
+                        current_device = None
+                        device_name_lc = device_name.lower()
+                        if _WIRELESS_TERMS_RE.search(device_name_lc):
                             current_device = {
                                 'name': device_name,
-                                'type': self._classify_device_by_name(device_name)
+                                'type': self._classify_device_by_name(device_name, device_name_lc)
                             }
-                    elif current_device and 'Product ID:' in line:
-                        current_device['product_id'] = line.split(':')[1].strip()
-                    elif current_device and 'Vendor ID:' in line:
-                        current_device['vendor_id'] = line.split(':')[1].strip()
+                    elif current_device and m.group('pid') is not None:
+                        current_device['product_id'] = m.group('pid')
+                    elif current_device and m.group('vid') is not None:
+                        current_device['vendor_id'] = m.group('vid')
                         # Add the device when we have enough info
                         devices.append(WirelessDevice(
                             name=current_device['name'],
@@ -398,26 +920,28 @@ class USBWirelessDetector(WirelessDetector):
                             interface="USB",
                             vendor_id=current_device.get('vendor_id'),
                             product_id=current_device.get('product_id'),
-                            status=DeviceStatus.CONNECTED,
-                            additional_info={"detection_method": "system_profiler"}
+                            status=DeviceStatus.CONNECTED
                         ))
                         current_device = None
         except Exception as e:
-            print(f"macOS USB fallback error: {e}")
+            logger.warning("macOS USB fallback error: %s", e)
         
         return devices
     
-    def _classify_device_by_name(self, name: str) -> DeviceType:
-        """Classify device based on name"""
-        name_lower = name.lower()
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _classify_device_by_name(name: str, name_lower: Optional[str] = None) -> DeviceType:
+        """Classify device based on name; pass name_lower when the caller already has it"""
+        if name_lower is None:
+            name_lower = name.lower()
         
-        if any(term in name_lower for term in ['receiver', 'dongle', 'unifying']):
+        if _DONGLE_RE.search(name_lower):
             return DeviceType.RF_DONGLE
-        elif any(term in name_lower for term in ['wifi', 'wireless lan', '802.11', 'wlan']):
+        elif _WIFI_RE.search(name_lower):
             return DeviceType.WIFI_ADAPTER
-        elif any(term in name_lower for term in ['bluetooth']):
+        elif _BLUETOOTH_RE.search(name_lower):
             return DeviceType.BLUETOOTH
-        elif any(term in name_lower for term in ['audio', 'headset', 'speaker', 'microphone']):
+        elif _AUDIO_RE.search(name_lower):
             return DeviceType.WIRELESS_AUDIO
         else:
             return DeviceType.UNKNOWN_WIRELESS
@@ -426,39 +950,83 @@ class USBWirelessDetector(WirelessDetector):
         """Check if USB device is likely a wireless device"""
         try:
             # Check vendor ID
-            if device.idVendor in self.WIRELESS_VENDORS:
+            if device.idVendor in self._WIRELESS_VIDS:
                 return True
             
-            # Check device class (some wireless devices use HID class)
-            if hasattr(device, 'bDeviceClass'):
-                # Class 9 is Hub, Class 3 is HID (keyboards/mice)
-                if device.bDeviceClass in [3, 9]:
-                    return True
-            
-            # Check interface class
-            try:
-                for cfg in device:
-                    for intf in cfg:
-                        if intf.bInterfaceClass in [3, 224]:  # HID or Wireless
-                            return True
-            except:
-                pass
-            
+            key = (device.bus, device.address, device.idVendor, device.idProduct)
+            is_wireless = self._wireless_check_cache.get(key)
+            if is_wireless is None:
+                is_wireless = self._check_device_classes(device)
+                self._wireless_check_cache[key] = is_wireless
+            return is_wireless
+        
         except Exception:
+            return False
+    
+    def _check_device_classes(self, device) -> bool:
+        """Check device and interface classes of a USB device"""
+        device_class = getattr(device, 'bDeviceClass', None)
+        
+        # Check device class (some wireless devices use HID class)
+        if device_class in self._DEVICE_CLASS_WIRELESS:
+            return True
+        
+        # Only composite devices describe themselves in interface descriptors,
+        # walking those costs extra descriptor reads
+        if device_class not in self._DEVICE_CLASS_COMPOSITE:
+            return False
+        
+        try:
+            for cfg in device:
+                for intf in cfg:
+                    if intf.bInterfaceClass in self._INTF_CLASS_WIRELESS:
+                        return True
+        except usb.core.USBError:
             pass
         
         return False
     
+    def refresh(self):
+        super().refresh()
+        _invalidate_usb_snapshot()
+        self._device_info_cache.clear()
+        self._wireless_check_cache.clear()
+    
     def _get_device_info(self, device) -> WirelessDevice:
+        """Extract device information, memoized per physical device"""
+        key = (device.idVendor, device.idProduct, device.bus, device.address)
+        device_info = self._device_info_cache.get(key)
+        if device_info is None:
+            device_info = self._read_device_info(device)
+            self._device_info_cache[key] = device_info
+        return device_info
+    
+    def _get_product_name(self, device) -> str:
+        """Get the product string, reading it from the device only for known wireless vendors"""
+        key = (device.idVendor, device.idProduct)
+        product_name = self._product_name_cache.get(key)
+        if product_name is not None:
+            return product_name
+        
+        fallback_name = f"USB Device {device.idVendor:04x}:{device.idProduct:04x}"
+        if device.idVendor not in self._WIRELESS_VIDS:
+            # Reading the string descriptor is a control transfer, skip it for unknown vendors
+            return fallback_name
+        
+        try:
+            product_name = usb.util.get_string(device, device.iProduct) or fallback_name
+        except:
+            product_name = fallback_name
+        
+        self._product_name_cache[key] = product_name
+        return product_name
+    
+    def _read_device_info(self, device) -> WirelessDevice:
         """Extract device information"""
         try:
             vendor_name = self.WIRELESS_VENDORS.get(device.idVendor, "Unknown")
             
-            # Try to get product name
-            try:
-                product_name = usb.util.get_string(device, device.iProduct)
-            except:
-                product_name = f"USB Device {device.idVendor:04x}:{device.idProduct:04x}"
+            product_name = self._get_product_name(device)
             
             # Determine device type based on product name or vendor
             device_type = self._classify_device(product_name, vendor_name)
@@ -469,13 +1037,7 @@ class USBWirelessDetector(WirelessDetector):
                 interface=f"USB (Bus {device.bus}, Device {device.address})",
                 vendor_id=f"{device.idVendor:04x}",
                 product_id=f"{device.idProduct:04x}",
-                status=DeviceStatus.CONNECTED,
-                additional_info={
-                    "bus": device.bus,
-                    "address": device.address,
-                    "vendor_name": vendor_name,
-                    "detection_method": "pyusb"
-                }
+                status=DeviceStatus.CONNECTED
             )
         
         except Exception as e:
@@ -487,23 +1049,21 @@ class USBWirelessDetector(WirelessDetector):
                 additional_info={"error": str(e)}
             )
     
-    def _classify_device(self, product_name: str, vendor_name: str) -> DeviceType:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _classify_device(product_name: str, vendor_name: str) -> DeviceType:
         """Classify device based on name and vendor"""
         product_lower = product_name.lower()
-        vendor_lower = vendor_name.lower()
         
-        if any(term in product_lower for term in ['receiver', 'dongle', 'unifying']):
+        if _DONGLE_RE.search(product_lower):
             return DeviceType.RF_DONGLE
-        elif any(term in product_lower for term in ['wifi', 'wireless lan', '802.11', 'wlan']):
+        elif _WIFI_RE.search(product_lower):
             return DeviceType.WIFI_ADAPTER
-        elif any(term in product_lower for term in ['audio', 'headset', 'speaker', 'microphone']):
+        elif _AUDIO_RE.search(product_lower):
             return DeviceType.WIRELESS_AUDIO
         else:
             return DeviceType.RF_DONGLE  # Assume RF dongle for most wireless USB devices
     
-    def can_manage_device(self, device: WirelessDevice) -> bool:
-        return device.device_type in [DeviceType.RF_DONGLE, DeviceType.WIFI_ADAPTER]
-    
     def enable_device(self, device: WirelessDevice) -> bool:
         # USB devices are typically managed by the OS
         # This would require platform-specific implementation
@@ -517,11 +1077,27 @@ class USBWirelessDetector(WirelessDetector):
 class NetworkWirelessDetector(WirelessDetector):
     """Network interface wireless detector"""
     
-    def detect_devices(self) -> List[WirelessDevice]:
+    managed_types = frozenset({DeviceType.WIFI_ADAPTER})
+    
+    def __init__(self):
+        self._detect_platform_fallback = {
+            "Linux": self._detect_linux_network_fallback,
+            "Windows": self._detect_windows_network_fallback,
+            "Darwin": self._detect_macos_network_fallback,
+        }.get(_PLATFORM, _no_devices)
+    
+    @ttl_cache(seconds=5)
+    async def detect_devices_async(self) -> List[WirelessDevice]:
         devices = []
         
+        if _PLATFORM == "Linux" and os.path.isdir(_SYSFS_NET):
+            try:
+                return self._detect_sysfs_interfaces()
+            except OSError as e:
+                logger.warning("Error reading %s: %s", _SYSFS_NET, e)
+        
         if not psutil:
-            return self._detect_network_fallback()
+            return await self._detect_network_fallback()
         
         try:
             # Get network interfaces
@@ -534,60 +1110,103 @@ class NetworkWirelessDetector(WirelessDetector):
                     devices.append(device_info)
         
         except Exception as e:
-            print(f"Error detecting network wireless devices: {e}")
-            return self._detect_network_fallback()
+            logger.warning("Error detecting network wireless devices: %s", e)
+            return await self._detect_network_fallback()
+        
+        return devices
+    
+    def _detect_sysfs_interfaces(self) -> List[WirelessDevice]:
+        """Linux detection straight from /sys/class/net, no name heuristics needed"""
+        devices = []
+        
+        with os.scandir(_SYSFS_NET) as entries:
+            for entry in entries:
+                if not (os.path.isdir(f'{entry.path}/wireless') or
+                        os.path.exists(f'{entry.path}/phy80211')):
+                    continue
+                
+                mac_address = self._read_sysfs_attr(entry.path, 'address')
+                operstate = self._read_sysfs_attr(entry.path, 'operstate')
+                flags = self._read_sysfs_attr(entry.path, 'flags')
+                
+                # Administrative up/down, the same thing psutil reports as isup
+                status = DeviceStatus.UNKNOWN
+                if flags is not None:
+                    status = DeviceStatus.ENABLED if int(flags, 16) & _IFF_UP else DeviceStatus.DISABLED
+                
+                devices.append(WirelessDevice(
+                    name=f"Wireless Interface {entry.name}",
+                    device_type=DeviceType.WIFI_ADAPTER,
+                    interface=entry.name,
+                    mac_address=mac_address,
+                    status=status,
+                    additional_info={"operstate": operstate}
+                ))
         
         return devices
     
-    def _detect_network_fallback(self) -> List[WirelessDevice]:
+    async def refresh_device_async(self, device: WirelessDevice) -> Optional[DeviceStatus]:
+        if _PLATFORM != "Linux" or not os.path.isdir(_SYSFS_NET):
+            return await super().refresh_device_async(device)
+        
+        # One flags read for this interface
+        flags = self._read_sysfs_attr(os.path.join(_SYSFS_NET, device.interface), 'flags')
+        if flags is None:
+            return None
+        return DeviceStatus.ENABLED if int(flags, 16) & _IFF_UP else DeviceStatus.DISABLED
+    
+    @staticmethod
+    def _read_sysfs_attr(path: str, attr: str) -> Optional[str]:
+        try:
+            with open(f'{path}/{attr}') as f:
+                return f.read().strip()
+        except OSError:
+            return None
+    
+    async def _detect_network_fallback(self) -> List[WirelessDevice]:
         """Fallback network detection using system commands"""
         devices = []
         
         try:
-            if platform.system() == "Linux":
-                devices.extend(self._detect_linux_network_fallback())
-            elif platform.system() == "Windows":
-                devices.extend(self._detect_windows_network_fallback())
-            elif platform.system() == "Darwin":
-                devices.extend(self._detect_macos_network_fallback())
+            devices.extend(await self._detect_platform_fallback())
         except Exception as e:
-            print(f"Network fallback detection error: {e}")
+            logger.warning("Network fallback detection error: %s", e)
         
         return devices
     
-    def _detect_linux_network_fallback(self) -> List[WirelessDevice]:
+    async def _detect_linux_network_fallback(self) -> List[WirelessDevice]:
         """Linux network detection fallback"""
         devices = []
+        if not _CMD['iwconfig']:
+            return devices
         
         try:
             # Try iwconfig
-            result = subprocess.run(['iwconfig'], capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                for line in lines:
+            async with _CommandStream(_CMD['iwconfig'], timeout=5, max_lines=_IWCONFIG_MAX_LINES) as lines:
+                async for line in lines:
                     if 'IEEE 802.11' in line:
                         interface_name = line.split()[0]
                         devices.append(WirelessDevice(
                             name=f"Wireless Interface {interface_name}",
                             device_type=DeviceType.WIFI_ADAPTER,
                             interface=interface_name,
-                            status=DeviceStatus.ENABLED,
-                            additional_info={"detection_method": "iwconfig"}
+                            status=DeviceStatus.ENABLED
                         ))
         except Exception as e:
-            print(f"Linux network fallback error: {e}")
+            logger.warning("Linux network fallback error: %s", e)
         
         return devices
     
-    def _detect_windows_network_fallback(self) -> List[WirelessDevice]:
+    async def _detect_windows_network_fallback(self) -> List[WirelessDevice]:
         """Windows network detection fallback"""
         devices = []
+        if not _CMD['netsh']:
+            return devices
         
         try:
-            result = subprocess.run(['netsh', 'wlan', 'show', 'interfaces'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
+            output = await _run_command(_CMD['netsh'], 'wlan', 'show', 'interfaces', timeout=10)
+            if output is not None:
+                lines = output.split('\n')
                 current_interface = None
                 
                 for line in lines:
@@ -606,31 +1225,29 @@ class NetworkWirelessDetector(WirelessDetector):
                             name=f"Wireless Interface {current_interface['name']}",
                             device_type=DeviceType.WIFI_ADAPTER,
                             interface=current_interface['name'],
-                            status=current_interface['status'],
-                            additional_info={"detection_method": "netsh"}
+                            status=current_interface['status']
                         ))
                         current_interface = None
         except Exception as e:
-            print(f"Windows network fallback error: {e}")
+            logger.warning("Windows network fallback error: %s", e)
         
         return devices
     
-    def _detect_macos_network_fallback(self) -> List[WirelessDevice]:
+    async def _detect_macos_network_fallback(self) -> List[WirelessDevice]:
         """macOS network detection fallback"""
         devices = []
+        if not _CMD['networksetup']:
+            return devices
         
         try:
-            result = subprocess.run(['networksetup', '-listallhardwareports'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                lines = result.stdout.split('\n')
+            async with _CommandStream(_CMD['networksetup'], '-listallhardwareports', timeout=10) as lines:
                 current_port = None
                 
-                for line in lines:
+                async for line in lines:
                     line = line.strip()
                     if line.startswith('Hardware Port:'):
                         port_name = line.split(':', 1)[1].strip()
-                        if 'wi-fi' in port_name.lower() or 'wireless' in port_name.lower():
+                        if _WIRELESS_PORT_RE.search(port_name.lower()):
                             current_port = {'name': port_name}
                     elif current_port and line.startswith('Device:'):
                         device_name = line.split(':', 1)[1].strip()
@@ -638,21 +1255,17 @@ class NetworkWirelessDetector(WirelessDetector):
                             name=f"Wireless Interface {current_port['name']}",
                             device_type=DeviceType.WIFI_ADAPTER,
                             interface=device_name,
-                            status=DeviceStatus.ENABLED,
-                            additional_info={"detection_method": "networksetup"}
+                            status=DeviceStatus.ENABLED
                         ))
                         current_port = None
         except Exception as e:
-            print(f"macOS network fallback error: {e}")
+            logger.warning("macOS network fallback error: %s", e)
         
         return devices
     
     def _is_wireless_interface(self, interface_name: str) -> bool:
         """Check if interface is wireless"""
-        wireless_indicators = ['wlan', 'wifi', 'wl', 'ath', 'ra', 'wireless']
-        name_lower = interface_name.lower()
-        
-        return any(indicator in name_lower for indicator in wireless_indicators)
+        return _WIRELESS_IFACE_RE.search(interface_name.lower()) is not None
     
     def _get_interface_info(self, interface_name: str, addresses, interface_stats) -> WirelessDevice:
         """Get information about wireless interface"""
@@ -679,28 +1292,21 @@ class NetworkWirelessDetector(WirelessDetector):
             interface=interface_name,
             mac_address=mac_address,
             status=status,
-            additional_info={
-                "interface_name": interface_name,
-                "addresses": len(addresses),
-                "detection_method": "psutil"
-            }
+            additional_info={"addresses": len(addresses)}
         )
     
-    def can_manage_device(self, device: WirelessDevice) -> bool:
-        return device.device_type == DeviceType.WIFI_ADAPTER
-    
     def enable_device(self, device: WirelessDevice) -> bool:
         try:
-            interface_name = device.additional_info.get("interface_name", device.interface)
+            interface_name = device.interface
             
-            if platform.system() == "Linux":
-                subprocess.run(['ip', 'link', 'set', interface_name, 'up'], 
-                             capture_output=True, timeout=5)
+            if _PLATFORM == "Linux" and _CMD['ip']:
+                subprocess.run([_CMD['ip'], 'link', 'set', interface_name, 'up'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return True
-            elif platform.system() == "Windows":
+            elif _PLATFORM == "Windows" and _CMD['netsh']:
                 # Windows interface management would require admin privileges
-                subprocess.run(['netsh', 'interface', 'set', 'interface', interface_name, 'enabled'], 
-                             capture_output=True, timeout=5)
+                subprocess.run([_CMD['netsh'], 'interface', 'set', 'interface', interface_name, 'enabled'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return True
         except Exception:
             pass
@@ -708,15 +1314,15 @@ class NetworkWirelessDetector(WirelessDetector):
     
     def disable_device(self, device: WirelessDevice) -> bool:
         try:
-            interface_name = device.additional_info.get("interface_name", device.interface)
+            interface_name = device.interface
             
-            if platform.system() == "Linux":
-                subprocess.run(['ip', 'link', 'set', interface_name, 'down'], 
-                             capture_output=True, timeout=5)
+            if _PLATFORM == "Linux" and _CMD['ip']:
+                subprocess.run([_CMD['ip'], 'link', 'set', interface_name, 'down'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return True
-            elif platform.system() == "Windows":
-                subprocess.run(['netsh', 'interface', 'set', 'interface', interface_name, 'disabled'], 
-                             capture_output=True, timeout=5)
+            elif _PLATFORM == "Windows" and _CMD['netsh']:
+                subprocess.run([_CMD['netsh'], 'interface', 'set', 'interface', interface_name, 'disabled'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5)
                 return True
         except Exception:
             pass
@@ -3,9 +3,18 @@
 Main device manager that coordinates all wireless device detectors
 """
 
+import logging
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from models import WirelessDevice, DeviceType, DeviceStatus
-from detectors import BluetoothDetector, USBWirelessDetector, NetworkWirelessDetector
+from detectors import BluetoothDetector, USBWirelessDetector, NetworkWirelessDetector, DetectorService
+
+logger = logging.getLogger(__name__)
+
+# Upper bound in seconds for a single detector during a scan
+SCAN_TIMEOUT = 30
 
 class WirelessDeviceManager:
     """Main manager class that coordinates all detectors"""
@@ -18,115 +27,209 @@ class WirelessDeviceManager:
         ]
         self.devices: List[WirelessDevice] = []
         self._scan_callbacks = []
+        # Route by device type; the first detector listing a type owns it,
+        # as with the old linear search
+        self._by_type = {}
+        for detector in self.detectors:
+            for device_type in detector.managed_types:
+                self._by_type.setdefault(device_type, detector)
+        self._by_name = {}
+        self._by_mac = {}
+        self._by_id = {}
+        self._found_by = {}  # id(device) -> detector that reported it
+        self._by_type_buckets = {}
+        self._by_status_buckets = {}
+        # Scans (worker thread) and status updates (GUI thread) both touch the indexes
+        self._index_lock = threading.Lock()
+        # Detectors are I/O bound; one long-lived pool serves scans and single-device refreshes
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='airmon-detect')
     
     def add_scan_callback(self, callback):
         """Add a callback to be called when devices are scanned"""
         self._scan_callbacks.append(callback)
     
-    def scan_devices(self) -> List[WirelessDevice]:
-        """Scan for all wireless devices using all detectors"""
-        self.devices = []
+    def scan_devices(self, force: bool = False) -> List[WirelessDevice]:
+        """Scan for all wireless devices using all detectors
         
-        for detector in self.detectors:
+        With force=True the detectors drop their cached enumerations first,
+        as a user-initiated scan should see the hardware as it is now.
+        """
+        if force:
+            for detector in self.detectors:
+                detector.refresh()
+        
+        merged = {}
+        found_by = {}
+        
+        futures = [self._io_pool.submit(detector.detect_devices) for detector in self.detectors]
+        for future, detector in zip(futures, self.detectors):
             try:
-                detected_devices = detector.detect_devices()
-                self.devices.extend(detected_devices)
+                detected_devices = future.result(timeout=SCAN_TIMEOUT)
             except Exception as e:
-                print(f"Error with detector {detector.__class__.__name__}: {e}")
+                logger.warning("Error with detector %s: %s", detector.__class__.__name__, e)
+                continue
+            
+            # Detectors overlap (a USB Bluetooth dongle, say); keep the first report
+            for device in detected_devices:
+                key = self._merge_key(device)
+                if key not in merged:
+                    merged[key] = device
+                    found_by[id(device)] = detector
+        
+        with self._index_lock:
+            self.devices = list(merged.values())
+            self._found_by = found_by
+            self._index_devices()
+        
+        # Format display strings here, off the GUI thread
+        for device in self.devices:
+            device.render()
         
         # Notify callbacks
         for callback in self._scan_callbacks:
             try:
                 callback(self.devices)
             except Exception as e:
-                print(f"Error in scan callback: {e}")
+                logger.warning("Error in scan callback: %s", e)
         
         return self.devices
     
+    @staticmethod
+    def _merge_key(device: WirelessDevice):
+        """Identity used to drop the same device reported by more than one detector"""
+        if device.mac_address:
+            return device.mac_address
+        if device.vendor_id:
+            return (device.vendor_id, device.product_id, device.interface)
+        # Without hardware IDs, several devices can share an interface label
+        return (device.interface, device.name)
+    
+    def _index_devices(self):
+        """Rebuild the lookup tables for the current device list (caller holds _index_lock)"""
+        by_name = {}
+        by_mac = {}
+        # First device wins, matching the old linear search order
+        for device in self.devices:
+            by_name.setdefault(device.name, device)
+            if device.mac_address:
+                by_mac.setdefault(device.mac_address, device)
+        self._by_name = by_name
+        self._by_mac = by_mac
+        self._by_id = {id(device): device for device in self.devices}
+        
+        by_type = defaultdict(list)
+        by_status = defaultdict(list)
+        for device in self.devices:
+            by_type[device.device_type].append(device)
+            by_status[device.status].append(device)
+        self._by_type_buckets = by_type
+        self._by_status_buckets = by_status
+    
     def get_devices_by_type(self, device_type: DeviceType) -> List[WirelessDevice]:
         """Get devices filtered by type"""
-        return [device for device in self.devices if device.device_type == device_type]
+        return list(self._by_type_buckets.get(device_type, ()))
     
     def get_devices_by_status(self, status: DeviceStatus) -> List[WirelessDevice]:
         """Get devices filtered by status"""
-        return [device for device in self.devices if device.status == status]
+        return list(self._by_status_buckets.get(status, ()))
     
     def get_device_by_name(self, name: str) -> Optional[WirelessDevice]:
         """Get a specific device by name"""
-        for device in self.devices:
-            if device.name == name:
-                return device
-        return None
+        return self._by_name.get(name)
     
     def get_device_by_mac(self, mac_address: str) -> Optional[WirelessDevice]:
         """Get a specific device by MAC address"""
-        for device in self.devices:
-            if device.mac_address == mac_address:
-                return device
-        return None
+        return self._by_mac.get(mac_address)
     
     def enable_device(self, device: WirelessDevice) -> bool:
         """Enable a device using the appropriate detector"""
-        for detector in self.detectors:
-            if detector.can_manage_device(device):
-                success = detector.enable_device(device)
-                if success:
-                    # Update device status
-                    device.status = DeviceStatus.ENABLED
-                return success
-        return False
+        detector = self.get_device_detector(device)
+        if detector is None:
+            return False
+        success = detector.enable_device(device)
+        if success:
+            self._set_status(device, DeviceStatus.ENABLED)
+        return success
     
     def disable_device(self, device: WirelessDevice) -> bool:
         """Disable a device using the appropriate detector"""
-        for detector in self.detectors:
-            if detector.can_manage_device(device):
-                success = detector.disable_device(device)
-                if success:
-                    # Update device status
-                    device.status = DeviceStatus.DISABLED
-                return success
-        return False
+        detector = self.get_device_detector(device)
+        if detector is None:
+            return False
+        success = detector.disable_device(device)
+        if success:
+            self._set_status(device, DeviceStatus.DISABLED)
+        return success
+    
+    def _set_status(self, device: WirelessDevice, status: DeviceStatus):
+        """Update a device's status and keep the status buckets in step"""
+        with self._index_lock:
+            if self._by_id.get(id(device)) is device and device.status is not status:
+                # By identity: equal-looking devices from other detectors may share the bucket
+                old = self._by_status_buckets[device.status]
+                self._by_status_buckets[device.status] = [d for d in old if d is not device]
+                self._by_status_buckets[status].append(device)
+            device.status = status
     
     def can_manage_device(self, device: WirelessDevice) -> bool:
         """Check if any detector can manage the given device"""
-        return any(detector.can_manage_device(device) for detector in self.detectors)
+        if self._by_type:
+            return device.device_type in self._by_type
+        return self.get_device_detector(device) is not None
     
     def get_manageable_devices(self) -> List[WirelessDevice]:
         """Get all devices that can be managed"""
-        return [device for device in self.devices if self.can_manage_device(device)]
+        return [device for device in self.devices if device.device_type in self._by_type]
     
     def get_device_statistics(self) -> dict:
         """Get statistics about detected devices"""
-        stats = {
+        type_counts = Counter(device.device_type for device in self.devices)
+        status_counts = Counter(device.status for device in self.devices)
+        
+        # Report in enum order and leave out empty buckets
+        return {
             'total_devices': len(self.devices),
-            'by_type': {},
-            'by_status': {},
-            'manageable': len(self.get_manageable_devices())
+            'by_type': {t.value: type_counts[t] for t in DeviceType if type_counts[t]},
+            'by_status': {s.value: status_counts[s] for s in DeviceStatus if status_counts[s]},
+            'manageable': sum(type_counts[t] for t in self._by_type)
         }
-        
-        # Count by type
-        for device_type in DeviceType:
-            count = len(self.get_devices_by_type(device_type))
-            if count > 0:
-                stats['by_type'][device_type.value] = count
-        
-        # Count by status
-        for status in DeviceStatus:
-            count = len(self.get_devices_by_status(status))
-            if count > 0:
-                stats['by_status'][status.value] = count
-        
-        return stats
     
     def refresh_device_status(self, device: WirelessDevice) -> bool:
         """Refresh the status of a specific device"""
-        # This would require re-scanning or checking the device status
-        # For now, we'll just re-scan all devices
-        return self.scan_devices()
+        # Ask the detector that reported the device rather than rescanning everything
+        detector = self._found_by.get(id(device)) or self.get_device_detector(device)
+        if detector is not None:
+            try:
+                status = self._io_pool.submit(detector.refresh_device, device).result(timeout=SCAN_TIMEOUT)
+            except Exception as e:
+                logger.warning("Error refreshing device %s: %s", device.name, e)
+                status = None
+            if status is not None:
+                self._set_status(device, status)
+                return True
+        
+        # Unknown to its detector (or no detector): fall back to a full scan
+        identity = (device.device_type, device.interface, device.mac_address or device.name)
+        return any((d.device_type, d.interface, d.mac_address or d.name) == identity
+                   for d in self.scan_devices())
     
     def get_device_detector(self, device: WirelessDevice):
         """Get the detector that can manage the given device"""
+        detector = self._by_type.get(device.device_type)
+        if detector is not None:
+            return detector
+        # Unknown type: fall back to asking each detector
         for detector in self.detectors:
             if detector.can_manage_device(device):
                 return detector
         return None
+    
+    def close(self):
+        """Release the detector pool, stop detector watchers and the detector loop"""
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        for detector in self.detectors:
+            try:
+                detector.close()
+            except Exception as e:
+                logger.warning("Error closing detector %s: %s", detector.__class__.__name__, e)
+        DetectorService.shutdown()
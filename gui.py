@@ -6,7 +6,8 @@ Modern GUI for Wireless Device Manager with battery monitoring and device manage
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
-import time
+import queue
+import logging
 from typing import Optional, List
 import platform
 
@@ -14,6 +15,21 @@ from models import WirelessDevice, DeviceType, DeviceStatus, SystemInfo
 from device_manager import WirelessDeviceManager
 from system_monitor import SystemMonitor
 
+logger = logging.getLogger(__name__)
+
+_PLATFORM = platform.system()
+
+# Filter combobox choices
+TYPE_FILTER_VALUES = ("All",) + tuple(t.value for t in DeviceType)
+STATUS_FILTER_VALUES = ("All",) + tuple(s.value for s in DeviceStatus)
+
+# Auto-refresh backs off from the minimum to the maximum while nothing changes
+MIN_SCAN_INTERVAL_MS = 5000
+MAX_SCAN_INTERVAL_MS = 60000
+
+# Row inserts in one refresh above which the tree columns are hidden during the update
+BULK_INSERT_ROWS = 10
+
 class ModernWirelessDeviceGUI:
     """Modern GUI for the Wireless Device Manager with enhanced features"""
     
@@ -29,8 +45,28 @@ class ModernWirelessDeviceGUI:
         
         # Variables
         self.scan_timer = None
+        self._scan_interval_ms = MIN_SCAN_INTERVAL_MS
+        self._last_scan_sig = None
         self.auto_refresh_var = tk.BooleanVar(value=False)
         self.selected_device = None
+        self._devices = []  # Last scan result, before filtering
+        
+        # Newest system monitor update waiting for the Tk loop
+        self._pending_sys = None
+        self._sys_scheduled = False
+        
+        # Tree bookkeeping so refreshes only touch rows that changed
+        self._tree_rows = {}      # device key -> (iid, (text, values))
+        self._tree_groups = {}    # type value -> (iid, header values)
+        self._tree_children = {}  # parent iid -> ordered child iids
+        self._tree_devices = {}   # iid -> WirelessDevice
+        
+        # One long-lived scan worker; at most one request waits behind a running scan
+        self._scan_q = queue.Queue(maxsize=1)
+        # Set when the user asked for a scan, so the worker bypasses detector caches
+        self._force_scan = threading.Event()
+        self._scan_worker_thread = threading.Thread(target=self._scan_worker, daemon=True)
+        self._scan_worker_thread.start()
         
         # Setup GUI
         self.setup_gui()
@@ -98,7 +134,7 @@ class ModernWirelessDeviceGUI:
         self.memory_label.grid(row=0, column=2, sticky=tk.W, padx=(0, 10))
         
         # Platform info
-        self.platform_label = ttk.Label(system_frame, text=f"Platform: {platform.system()}")
+        self.platform_label = ttk.Label(system_frame, text=f"Platform: {_PLATFORM}")
         self.platform_label.grid(row=1, column=0, columnspan=3, sticky=tk.W, pady=(5, 0))
     
     def setup_control_panel(self, parent):
@@ -111,7 +147,7 @@ class ModernWirelessDeviceGUI:
         button_frame = ttk.Frame(control_frame)
         button_frame.grid(row=0, column=0, sticky=tk.W)
         
-        self.scan_button = ttk.Button(button_frame, text="Scan Devices", command=self.scan_devices)
+        self.scan_button = ttk.Button(button_frame, text="Scan Devices", command=lambda: self.scan_devices(force=True))
         self.scan_button.pack(side=tk.LEFT, padx=(0, 5))
         
         self.refresh_button = ttk.Button(button_frame, text="Auto Refresh", command=self.toggle_auto_refresh)
@@ -135,17 +171,19 @@ class ModernWirelessDeviceGUI:
         ttk.Label(filter_frame, text="Filter by type:").pack(side=tk.LEFT, padx=(0, 5))
         self.type_filter_var = tk.StringVar(value="All")
         type_filter_combo = ttk.Combobox(filter_frame, textvariable=self.type_filter_var, 
-                                        values=["All"] + [t.value for t in DeviceType], 
+                                        values=TYPE_FILTER_VALUES, 
                                         state="readonly", width=15)
         type_filter_combo.pack(side=tk.LEFT, padx=(0, 10))
+        type_filter_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
         
         # Status filter
         ttk.Label(filter_frame, text="Filter by status:").pack(side=tk.LEFT, padx=(0, 5))
         self.status_filter_var = tk.StringVar(value="All")
         status_filter_combo = ttk.Combobox(filter_frame, textvariable=self.status_filter_var, 
-                                          values=["All"] + [s.value for s in DeviceStatus], 
+                                          values=STATUS_FILTER_VALUES, 
                                           state="readonly", width=15)
         status_filter_combo.pack(side=tk.LEFT, padx=(0, 10))
+        status_filter_combo.bind('<<ComboboxSelected>>', self.on_filter_change)
     
     def setup_main_content(self, parent):
         """Setup the main content area with device list and info panel"""
@@ -226,73 +264,155 @@ class ModernWirelessDeviceGUI:
         self.progress_bar = ttk.Progressbar(status_frame, variable=self.progress_var, mode='indeterminate')
         self.progress_bar.grid(row=0, column=1, sticky=tk.E, padx=(10, 0))
     
-    def scan_devices(self):
-        """Scan for devices in a separate thread"""
+    def scan_devices(self, force: bool = False):
+        """Queue a scan for the background worker
+        
+        force makes the scan query the hardware instead of cached results.
+        """
+        if force:
+            self._force_scan.set()
         self.status_label.config(text="Scanning devices...")
         self.scan_button.config(state="disabled")
         self.progress_bar.start()
         
-        # Run scan in thread to avoid GUI freezing
-        thread = threading.Thread(target=self._scan_thread)
-        thread.daemon = True
-        thread.start()
-    
-    def _scan_thread(self):
-        """Thread function for scanning devices"""
         try:
-            devices = self.manager.scan_devices()
-            # Update GUI in main thread
-            self.root.after(0, self._update_device_list, devices)
-        except Exception as e:
-            self.root.after(0, self._scan_error, str(e))
+            self._scan_q.put_nowait(True)
+        except queue.Full:
+            pass  # A scan is already pending, it will pick up this request too
+    
+    def _scan_worker(self):
+        """Worker thread that runs queued scans one at a time"""
+        while True:
+            if not self._scan_q.get():
+                return
+            try:
+                force = self._force_scan.is_set()
+                self._force_scan.clear()
+                devices = self.manager.scan_devices(force=force)
+                # Update GUI in main thread
+                self.root.after(0, self._update_device_list, devices)
+            except Exception as e:
+                self.root.after(0, self._scan_error, str(e))
     
     def _update_device_list(self, devices: List[WirelessDevice]):
-        """Update the device list in the GUI"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Group devices by type
-        device_groups = {}
-        for device in devices:
-            device_type = device.device_type.value
-            if device_type not in device_groups:
-                device_groups[device_type] = []
-            device_groups[device_type].append(device)
-        
-        # Add devices to tree grouped by type
-        for group_name, group_devices in device_groups.items():
-            # Add group header
-            group_id = self.tree.insert('', 'end', text='', 
-                                       values=(f"{group_name} ({len(group_devices)})", '', '', '', '', '', ''))
-            
-            # Add devices in group
-            for i, device in enumerate(group_devices):
-                battery_text = f"{device.battery_level}%" if device.battery_level is not None else "N/A"
-                signal_text = f"{device.signal_strength}%" if device.signal_strength is not None else "N/A"
-                
-                self.tree.insert(group_id, 'end', text=str(i+1),
-                               values=(
-                                   device.name,
-                                   device.device_type.value,
-                                   device.interface,
-                                   device.mac_address or 'N/A',
-                                   device.status.value,
-                                   battery_text,
-                                   signal_text
-                               ))
-        
-        # Expand all groups
-        for item in self.tree.get_children():
-            self.tree.item(item, open=True)
+        """Update the device list in the GUI after a scan"""
+        self._devices = devices
+        self._show_devices(self._filter_devices(devices))
         
         self.status_label.config(text=f"Found {len(devices)} devices")
         self.scan_button.config(state="normal")
         self.progress_bar.stop()
         
+        # Slow down while scans keep returning the same devices, speed up on change
+        sig = tuple(sorted((self._device_key(device), device._status_value) for device in devices))
+        if sig == self._last_scan_sig:
+            self._scan_interval_ms = min(self._scan_interval_ms * 2, MAX_SCAN_INTERVAL_MS)
+        else:
+            self._scan_interval_ms = MIN_SCAN_INTERVAL_MS
+        self._last_scan_sig = sig
+        
         # Schedule next scan if auto-refresh is enabled
         if self.auto_refresh_var.get():
-            self.scan_timer = self.root.after(5000, self.scan_devices)  # Scan every 5 seconds
+            self.scan_timer = self.root.after(self._scan_interval_ms, self.scan_devices)
+    
+    def _filter_devices(self, devices: List[WirelessDevice]) -> List[WirelessDevice]:
+        """Apply the type and status filters using the manager's per-scan buckets"""
+        type_value = self.type_filter_var.get()
+        status_value = self.status_filter_var.get()
+        
+        if type_value != "All":
+            devices = self.manager.get_devices_by_type(DeviceType(type_value))
+            if status_value != "All":
+                status = DeviceStatus(status_value)
+                devices = [device for device in devices if device.status is status]
+        elif status_value != "All":
+            devices = self.manager.get_devices_by_status(DeviceStatus(status_value))
+        return devices
+    
+    def on_filter_change(self, event=None):
+        """Re-render the last scan result with the selected filters"""
+        self._show_devices(self._filter_devices(self._devices))
+    
+    def _show_devices(self, devices: List[WirelessDevice]):
+        """Show the given devices in the tree, touching only rows that changed"""
+        # Group devices by type; the first device wins when two share a row key
+        device_groups = {}
+        keys = set()
+        for device in devices:
+            key = self._device_key(device)
+            if key in keys:
+                continue
+            keys.add(key)
+            device_groups.setdefault(device._type_value, []).append((key, device))
+        
+        # Hiding the data columns while many rows go in skips per-row column layout
+        bulk = len(keys - self._tree_rows.keys()) >= BULK_INSERT_ROWS
+        if bulk:
+            self.tree.configure(displaycolumns=())
+        try:
+            self._sync_tree(device_groups, keys)
+        finally:
+            if bulk:
+                self.tree.configure(displaycolumns='#all')
+        
+        # Point the selection at the freshly scanned device object, or drop it
+        # when its row was removed (filtered out or gone from the scan)
+        if self.selected_device is not None:
+            selection = self.tree.selection()
+            self.selected_device = self._tree_devices.get(selection[0]) if selection else None
+            self.update_device_info()
+            self.update_button_states()
+    
+    def _sync_tree(self, device_groups: dict, keys: set):
+        """Apply a grouped scan result to the tree with the fewest Tk calls"""
+        # Remove rows for devices that went away, then groups left empty
+        for key in self._tree_rows.keys() - keys:
+            iid = self._tree_rows.pop(key)[0]
+            self._tree_devices.pop(iid, None)
+            self._tree_children.pop(iid, None)
+            self.tree.delete(iid)
+        for group_name in self._tree_groups.keys() - device_groups.keys():
+            group_id = self._tree_groups.pop(group_name)[0]
+            self._tree_children.pop(group_id, None)
+            self.tree.delete(group_id)
+        
+        group_ids = []
+        for group_name, group_devices in device_groups.items():
+            header = (f"{group_name} ({len(group_devices)})", '', '', '', '', '', '')
+            group_id, old_header = self._tree_groups.get(group_name, (None, None))
+            if group_id is None:
+                group_id = self.tree.insert('', 'end', text='', values=header, open=True)
+            elif header != old_header:
+                self.tree.item(group_id, values=header)
+            self._tree_groups[group_name] = (group_id, header)
+            group_ids.append(group_id)
+            
+            row_ids = []
+            for i, (key, device) in enumerate(group_devices):
+                row = (str(i+1), device.render()['values'])
+                
+                iid, old_row = self._tree_rows.get(key, (None, None))
+                if iid is None:
+                    iid = self.tree.insert(group_id, 'end', text=row[0], values=row[1])
+                elif row != old_row:
+                    self.tree.item(iid, text=row[0], values=row[1])
+                self._tree_rows[key] = (iid, row)
+                self._tree_devices[iid] = device
+                row_ids.append(iid)
+            
+            self._set_tree_order(group_id, tuple(row_ids))
+        self._set_tree_order('', tuple(group_ids))
+    
+    @staticmethod
+    def _device_key(device: WirelessDevice):
+        """Stable tree row key for a device across scans"""
+        return (device._type_value, device.mac_address or device.name)
+    
+    def _set_tree_order(self, parent: str, children: tuple):
+        """Reorder a tree node's children in one call when the order changed"""
+        if self._tree_children.get(parent) != children:
+            self.tree.set_children(parent, *children)
+            self._tree_children[parent] = children
     
     def _scan_error(self, error_message: str):
         """Handle scan errors"""
@@ -306,7 +426,8 @@ class ModernWirelessDeviceGUI:
         if self.auto_refresh_var.get():
             if self.scan_timer:
                 self.root.after_cancel(self.scan_timer)
-            self.scan_devices()
+            self._scan_interval_ms = MIN_SCAN_INTERVAL_MS
+            self.scan_devices(force=True)
         else:
             if self.scan_timer:
                 self.root.after_cancel(self.scan_timer)
@@ -328,20 +449,7 @@ class ModernWirelessDeviceGUI:
     
     def get_device_from_tree_item(self, item) -> Optional[WirelessDevice]:
         """Get device object from tree item"""
-        values = self.tree.item(item, 'values')
-        if len(values) < 5:
-            return None
-        
-        name, device_type_str, interface, mac_address, status_str = values[:5]
-        
-        # Find the actual device object
-        for device in self.manager.devices:
-            if (device.name == name and 
-                device.device_type.value == device_type_str and
-                device.interface == interface):
-                return device
-        
-        return None
+        return self._tree_devices.get(item)
     
     def update_button_states(self):
         """Update enable/disable button states based on selected device"""
@@ -360,40 +468,17 @@ class ModernWirelessDeviceGUI:
             return
         
         device = self.selected_device
-        info = f"Device Information\n"
-        info += f"{'='*50}\n\n"
-        info += f"Name: {device.name}\n"
-        info += f"Type: {device.device_type.value}\n"
-        info += f"Interface: {device.interface}\n"
-        info += f"MAC Address: {device.mac_address or 'N/A'}\n"
-        info += f"Status: {device.status.value}\n"
-        
-        if device.battery_level is not None:
-            info += f"Battery: {device.battery_level}%\n"
-        if device.signal_strength is not None:
-            info += f"Signal: {device.signal_strength}%\n"
-        
-        if device.vendor_id:
-            info += f"Vendor ID: {device.vendor_id}\n"
-        if device.product_id:
-            info += f"Product ID: {device.product_id}\n"
-        
-        if device.additional_info:
-            info += f"\nAdditional Information:\n"
-            info += f"{'-'*30}\n"
-            for key, value in device.additional_info.items():
-                info += f"{key.replace('_', ' ').title()}: {value}\n"
-        
-        # Management capabilities
-        info += f"\nManagement Capabilities:\n"
-        info += f"{'-'*30}\n"
         manageable = self.manager.can_manage_device(device)
-        info += f"Can be managed: {'Yes' if manageable else 'No'}\n"
-        
-        if manageable:
-            info += f"Available actions: Enable, Disable\n"
-        else:
-            info += f"Note: This device type may require manual management\n"
+        info = "\n".join((
+            device.render()['info'],
+            # Management capabilities
+            "Management Capabilities:",
+            '-' * 30,
+            f"Can be managed: {'Yes' if manageable else 'No'}",
+            "Available actions: Enable, Disable" if manageable
+            else "Note: This device type may require manual management",
+            "",
+        ))
         
         self.info_text.delete(1.0, tk.END)
         self.info_text.insert(1.0, info)
@@ -413,7 +498,7 @@ class ModernWirelessDeviceGUI:
             success = self.manager.enable_device(device)
             if success:
                 messagebox.showinfo("Success", f"Device '{device.name}' enabled successfully.")
-                self.scan_devices()  # Refresh to show new status
+                self._refresh_device_row(device)
             else:
                 messagebox.showwarning("Warning", 
                                      f"Could not enable device '{device.name}'.\n"
@@ -438,7 +523,7 @@ class ModernWirelessDeviceGUI:
                 success = self.manager.disable_device(device)
                 if success:
                     messagebox.showinfo("Success", f"Device '{device.name}' disabled successfully.")
-                    self.scan_devices()  # Refresh to show new status
+                    self._refresh_device_row(device)
                 else:
                     messagebox.showwarning("Warning", 
                                          f"Could not disable device '{device.name}'.\n"
@@ -446,6 +531,22 @@ class ModernWirelessDeviceGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Error disabling device: {e}")
     
+    def _refresh_device_row(self, device: WirelessDevice):
+        """Show a device's new status without rescanning every detector"""
+        if self.status_filter_var.get() != "All":
+            # The device may have moved in or out of the filtered view
+            self.on_filter_change()
+        else:
+            key = self._device_key(device)
+            iid, old_row = self._tree_rows.get(key, (None, None))
+            if iid is not None and self._tree_devices.get(iid) is device:
+                row = (old_row[0], device.render()['values'])
+                self.tree.item(iid, values=row[1])
+                self._tree_rows[key] = (iid, row)
+        
+        self.update_device_info()
+        self.update_button_states()
+    
     def show_device_details(self, event=None):
         """Show detailed device information in a new window"""
         if not self.selected_device:
@@ -464,32 +565,23 @@ class ModernWirelessDeviceGUI:
         detail_text = scrolledtext.ScrolledText(detail_window, wrap=tk.WORD)
         detail_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Format detailed information
-        detail_info = f"Detailed Device Information\n"
-        detail_info += f"{'='*60}\n\n"
-        detail_info += f"Device Name: {device.name}\n"
-        detail_info += f"Device Type: {device.device_type.value}\n"
-        detail_info += f"Interface: {device.interface}\n"
-        detail_info += f"MAC Address: {device.mac_address or 'N/A'}\n"
-        detail_info += f"Status: {device.status.value}\n"
-        detail_info += f"Vendor ID: {device.vendor_id or 'N/A'}\n"
-        detail_info += f"Product ID: {device.product_id or 'N/A'}\n"
-        detail_info += f"Battery Level: {device.battery_level or 'N/A'}\n"
-        detail_info += f"Signal Strength: {device.signal_strength or 'N/A'}\n"
-        
-        if device.additional_info:
-            detail_info += f"\nAdditional Information:\n"
-            detail_info += f"{'-'*40}\n"
-            for key, value in device.additional_info.items():
-                detail_info += f"{key.replace('_', ' ').title()}: {value}\n"
-        
-        detail_text.insert(1.0, detail_info)
+        detail_text.insert(1.0, device.render()['detail'])
         detail_text.config(state=tk.DISABLED)
     
     def on_system_update(self, system_info, battery_info):
         """Callback for system monitoring updates"""
-        # Update system info display in main thread
-        self.root.after(0, self._update_system_display, system_info, battery_info)
+        # Latest update wins: only one display refresh is ever queued on the Tk loop
+        self._pending_sys = (system_info, battery_info)
+        if not self._sys_scheduled:
+            self._sys_scheduled = True
+            self.root.after(0, self._flush_system_update)
+    
+    def _flush_system_update(self):
+        """Show the most recent system update in the main thread"""
+        self._sys_scheduled = False
+        pending, self._pending_sys = self._pending_sys, None
+        if pending is not None:
+            self._update_system_display(*pending)
     
     def _update_system_display(self, system_info, battery_info):
         """Update system display in main thread"""
@@ -513,6 +605,13 @@ class ModernWirelessDeviceGUI:
             # Stop system monitoring
             self.system_monitor.stop_monitoring()
             
+            # Release scan workers
+            try:
+                self._scan_q.put_nowait(False)
+            except queue.Full:
+                pass
+            self.manager.close()
+            
             # Cancel any pending timers
             if self.scan_timer:
                 self.root.after_cancel(self.scan_timer)
@@ -520,7 +619,7 @@ class ModernWirelessDeviceGUI:
             # Close the window
             self.root.destroy()
         except Exception as e:
-            print(f"Error during cleanup: {e}")
+            logger.warning("Error during cleanup: %s", e)
             self.root.destroy()
     
     def run(self):
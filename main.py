@@ -17,41 +17,39 @@ Author: AI Assistant
 Python 3.9+ required
 """
 
+import importlib.util
 import platform
 import sys
 from gui import ModernWirelessDeviceGUI
 
+def _module_available(name):
+    """Check whether a module can be imported without executing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # A dotted name raises when its parent package is missing
+        return False
+
 def check_dependencies():
     """Check if required dependencies are available and provide installation instructions"""
     missing_deps = []
     optional_deps = []
     
     # Check for psutil
-    try:
-        import psutil
-    except ImportError:
+    if not _module_available("psutil"):
         missing_deps.append("psutil")
     
     # Check for USB support
-    try:
-        import usb.core
-        import usb.util
-    except ImportError:
+    if not (_module_available("usb.core") and _module_available("usb.util")):
         optional_deps.append("pyusb")
     
     # Platform-specific checks
     if platform.system() == "Windows":
-        try:
-            import wmi
-            import win32com.client
-            import pythoncom
-        except ImportError:
+        if not all(_module_available(name) for name in ("wmi", "win32com.client", "pythoncom")):
             optional_deps.extend(["wmi", "pywin32"])
     
     if platform.system() in ["Linux", "Darwin"]:
-        try:
-            import bluetooth
-        except ImportError:
+        if not _module_available("bluetooth"):
             optional_deps.append("pybluez")
     
     print("Dependency Status:")
@@ -3,7 +3,9 @@
 Data models for wireless device management
 """
 
-from dataclasses import dataclass
+import functools
+import sys
+from dataclasses import MISSING, dataclass, field, fields
 from typing import List, Dict, Optional, Any
 from enum import Enum
 
@@ -25,9 +27,42 @@ class DeviceStatus(Enum):
     DISABLED = "Disabled"
     UNKNOWN = "Unknown"
 
-@dataclass
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__ (dataclass(slots=True) needs Python 3.10)"""
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Defaults are already baked into the generated __init__
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop('__dict__', None)
+    namespace.pop('__weakref__', None)
+    namespace['__slots__'] = field_names
+    # Without the class attribute, init=False fields need their default set per instance
+    late_defaults = {f.name: f.default for f in fields(cls) if not f.init and f.default is not MISSING}
+    if late_defaults:
+        init = namespace['__init__']
+        
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs):
+            for name, value in late_defaults.items():
+                setattr(self, name, value)
+            init(self, *args, **kwargs)
+        
+        namespace['__init__'] = __init__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+def _slotted_dataclass(cls):
+    """dataclass with __slots__: native on Python 3.10+, rebuilt by _slotted on 3.9"""
+    if sys.version_info >= (3, 10):
+        return dataclass(slots=True)(cls)
+    return _slotted(dataclass(cls))
+
+@_slotted_dataclass
 class WirelessDevice:
-    """Data class representing a wireless device"""
+    """Data class representing a wireless device
+    
+    additional_info stays None unless a detector has extra facts to report.
+    """
     name: str
     device_type: DeviceType
     interface: str
@@ -37,13 +72,91 @@ class WirelessDevice:
     product_id: Optional[str] = None
     battery_level: Optional[int] = None
     signal_strength: Optional[int] = None
-    additional_info: Dict[str, Any] = None
+    additional_info: Optional[Dict[str, Any]] = None
+    # Formatted strings for the GUI, built lazily by render()
+    _display_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    # Enum .value strings, kept in step with device_type and status by __setattr__.
+    # No default: __init__ must not overwrite what assigning the enums already stored.
+    _type_value: str = field(init=False, repr=False, compare=False)
+    _status_value: str = field(init=False, repr=False, compare=False)
     
-    def __post_init__(self):
-        if self.additional_info is None:
-            self.additional_info = {}
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name[0] == '_':
+            return
+        if name == 'device_type':
+            object.__setattr__(self, '_type_value', value.value)
+        elif name == 'status':
+            object.__setattr__(self, '_status_value', value.value)
+        # Any public field change makes the rendered strings stale
+        object.__setattr__(self, '_display_cache', None)
+    
+    def render(self) -> Dict[str, Any]:
+        """Return the cached display strings for this device, building them on first use"""
+        if self._display_cache is not None:
+            return self._display_cache
+        
+        battery_text = f"{self.battery_level}%" if self.battery_level is not None else "N/A"
+        signal_text = f"{self.signal_strength}%" if self.signal_strength is not None else "N/A"
+        values = (
+            self.name,
+            self._type_value,
+            self.interface,
+            self.mac_address or 'N/A',
+            self._status_value,
+            battery_text,
+            signal_text
+        )
+        
+        info = [
+            "Device Information",
+            '=' * 50,
+            "",
+            f"Name: {self.name}",
+            f"Type: {self._type_value}",
+            f"Interface: {self.interface}",
+            f"MAC Address: {self.mac_address or 'N/A'}",
+            f"Status: {self._status_value}",
+        ]
+        if self.battery_level is not None:
+            info.append(f"Battery: {self.battery_level}%")
+        if self.signal_strength is not None:
+            info.append(f"Signal: {self.signal_strength}%")
+        if self.vendor_id:
+            info.append(f"Vendor ID: {self.vendor_id}")
+        if self.product_id:
+            info.append(f"Product ID: {self.product_id}")
+        
+        detail = [
+            "Detailed Device Information",
+            '=' * 60,
+            "",
+            f"Device Name: {self.name}",
+            f"Device Type: {self._type_value}",
+            f"Interface: {self.interface}",
+            f"MAC Address: {self.mac_address or 'N/A'}",
+            f"Status: {self._status_value}",
+            f"Vendor ID: {self.vendor_id or 'N/A'}",
+            f"Product ID: {self.product_id or 'N/A'}",
+            f"Battery Level: {self.battery_level or 'N/A'}",
+            f"Signal Strength: {self.signal_strength or 'N/A'}",
+        ]
+        
+        if self.additional_info:
+            extra = [f"{key.replace('_', ' ').title()}: {value}" for key, value in self.additional_info.items()]
+            info += ["", "Additional Information:", '-' * 30, *extra]
+            detail += ["", "Additional Information:", '-' * 40, *extra]
+        
+        self._display_cache = {
+            'battery': battery_text,
+            'signal': signal_text,
+            'values': values,
+            'info': "\n".join(info) + "\n",
+            'detail': "\n".join(detail) + "\n",
+        }
+        return self._display_cache
 
-@dataclass
+@_slotted_dataclass
 class SystemInfo:
     """System information data class"""
     platform: str
@@ -53,8 +166,41 @@ class SystemInfo:
     battery_plugged: bool = False
     cpu_usage: float = 0.0
     memory_usage: float = 0.0
-    network_interfaces: List[str] = None
+    network_interfaces: List[str] = field(default_factory=list)
+
+@_slotted_dataclass
+class NetIfTable:
+    """Network interfaces stored column-wise
+    
+    Addresses of interface i are addr_*[addr_starts[i]:addr_starts[i + 1]].
+    """
+    names: List[str] = field(default_factory=list)
+    is_up: List[Optional[bool]] = field(default_factory=list)
+    speeds: List[Optional[int]] = field(default_factory=list)
+    addr_starts: List[int] = field(default_factory=lambda: [0])
+    addr_families: List[int] = field(default_factory=list)
+    addr_addresses: List[str] = field(default_factory=list)
+    addr_netmasks: List[Optional[str]] = field(default_factory=list)
+    addr_broadcasts: List[Optional[str]] = field(default_factory=list)
     
-    def __post_init__(self):
-        if self.network_interfaces is None:
-            self.network_interfaces = []
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Per-interface dicts in the layout get_network_info used to return"""
+        interfaces = {}
+        starts = self.addr_starts
+        for i, name in enumerate(self.names):
+            up = self.is_up[i]
+            interfaces[name] = {
+                'name': name,
+                'addresses': [
+                    {
+                        'family': str(self.addr_families[j]),
+                        'address': self.addr_addresses[j],
+                        'netmask': self.addr_netmasks[j],
+                        'broadcast': self.addr_broadcasts[j]
+                    }
+                    for j in range(starts[i], starts[i + 1])
+                ],
+                'status': 'unknown' if up is None else ('up' if up else 'down'),
+                'speed': self.speeds[i]
+            }
+        return interfaces
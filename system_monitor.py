@@ -3,11 +3,14 @@
 System monitoring utilities for battery, CPU, memory, and network information
 """
 
+import ctypes
+import os
 import platform
+import re
 import subprocess
 import threading
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 
 # Platform-specific imports
@@ -16,7 +19,150 @@ try:
 except ImportError:
     psutil = None
 
-from models import SystemInfo
+from models import NetIfTable, SystemInfo
+
+# Constant for the life of the process; platform.platform() is slow on some systems
+_PLATFORM_SYSTEM = platform.system()
+_PLATFORM_PLATFORM = platform.platform()
+_PLATFORM_ARCH = platform.architecture()[0] or "Unknown"
+
+# Windows-specific imports
+wmi = None
+pythoncom = None
+if _PLATFORM_SYSTEM == "Windows":
+    try:
+        import wmi
+        import pythoncom
+    except ImportError:
+        wmi = None
+        pythoncom = None
+
+# Linux battery attributes read on every poll
+_POWER_SUPPLY_DIR = '/sys/class/power_supply'
+_LINUX_BATTERY_ATTRS = ('capacity', 'status', 'time_to_full_now', 'time_to_empty_now', 'power_now', 'temp')
+# Raw sysfs 'status' values that mean external power is connected
+_LINUX_PLUGGED_STATUS = frozenset((b'Charging\n', b'Full\n'))
+
+# Battery fields in system_profiler SPPowerDataType output, all matched in one sweep
+_MACOS_BATTERY_RE = re.compile(
+    r'Charge Remaining \(mAh\):\s*(?P<mah>\d+)|Fully Charged:\s*(?P<charged>Yes|No)'
+    r'|Time Remaining:\s*(?P<hours>\d+):(?P<minutes>\d+)')
+# Minimum age in seconds before system_profiler is run again
+_MACOS_BATTERY_TTL = 5.0
+
+# The monitor samples at the requested interval while readings move and
+# stretches the wait by _INTERVAL_BACKOFF per steady sample, up to MAX_MONITOR_INTERVAL
+MIN_MONITOR_INTERVAL = 0.5
+MAX_MONITOR_INTERVAL = 30.0
+_INTERVAL_BACKOFF = 1.5
+# CPU/memory changes below this many percentage points count as steady
+_STEADY_TOLERANCE = 2.0
+# Callbacks still hear from the monitor this often (seconds) when nothing changed
+_NOTIFY_MAX_SILENCE = 10.0
+
+class _IOKitPowerSources:
+    """In-process battery readout through IOKit's IOPowerSources API (macOS)
+    
+    Reads the same power source dictionaries system_profiler and psutil use,
+    without forking a process.
+    """
+    
+    _KEYS = ('Current Capacity', 'Max Capacity', 'Power Source State',
+             'Time to Empty', 'Time to Full Charge')
+    _kCFStringEncodingUTF8 = 0x08000100
+    _kCFNumberSInt64Type = 4
+    
+    def __init__(self):
+        iokit = ctypes.CDLL('/System/Library/Frameworks/IOKit.framework/IOKit')
+        cf = ctypes.CDLL('/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation')
+        
+        iokit.IOPSCopyPowerSourcesInfo.restype = ctypes.c_void_p
+        iokit.IOPSCopyPowerSourcesInfo.argtypes = []
+        iokit.IOPSCopyPowerSourcesList.restype = ctypes.c_void_p
+        iokit.IOPSCopyPowerSourcesList.argtypes = [ctypes.c_void_p]
+        iokit.IOPSGetPowerSourceDescription.restype = ctypes.c_void_p
+        iokit.IOPSGetPowerSourceDescription.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        
+        cf.CFArrayGetCount.restype = ctypes.c_long
+        cf.CFArrayGetCount.argtypes = [ctypes.c_void_p]
+        cf.CFArrayGetValueAtIndex.restype = ctypes.c_void_p
+        cf.CFArrayGetValueAtIndex.argtypes = [ctypes.c_void_p, ctypes.c_long]
+        cf.CFDictionaryGetValue.restype = ctypes.c_void_p
+        cf.CFDictionaryGetValue.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        cf.CFGetTypeID.restype = ctypes.c_ulong
+        cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+        cf.CFNumberGetTypeID.restype = ctypes.c_ulong
+        cf.CFStringGetTypeID.restype = ctypes.c_ulong
+        cf.CFNumberGetValue.restype = ctypes.c_bool
+        cf.CFNumberGetValue.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+        cf.CFStringGetCString.restype = ctypes.c_bool
+        cf.CFStringGetCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFRelease.restype = None
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        
+        self._iokit = iokit
+        self._cf = cf
+        self._number_type = cf.CFNumberGetTypeID()
+        self._string_type = cf.CFStringGetTypeID()
+        # Dictionary keys live as long as the process, create them once
+        self._keys = {name: cf.CFStringCreateWithCString(None, name.encode(), self._kCFStringEncodingUTF8)
+                      for name in self._KEYS}
+    
+    def read(self) -> Dict[str, Any]:
+        """Return percentage/plugged/time_left of the first battery, {} when there is none"""
+        iokit, cf = self._iokit, self._cf
+        blob = iokit.IOPSCopyPowerSourcesInfo()
+        if not blob:
+            return {}
+        try:
+            sources = iokit.IOPSCopyPowerSourcesList(blob)
+            if not sources:
+                return {}
+            try:
+                for i in range(cf.CFArrayGetCount(sources)):
+                    # The description is owned by blob, not released separately
+                    desc = iokit.IOPSGetPowerSourceDescription(blob, cf.CFArrayGetValueAtIndex(sources, i))
+                    if not desc:
+                        continue
+                    current = self._number(desc, 'Current Capacity')
+                    maximum = self._number(desc, 'Max Capacity')
+                    if current is None or not maximum:
+                        continue
+                    
+                    info = {
+                        'percentage': min(100, max(0, current * 100 // maximum)),
+                        'plugged': self._string(desc, 'Power Source State') == 'AC Power',
+                    }
+                    # Minutes, -1 while macOS is still estimating
+                    minutes = self._number(desc, 'Time to Full Charge' if info['plugged'] else 'Time to Empty')
+                    if minutes is not None and minutes > 0:
+                        info['time_left'] = minutes * 60  # Convert to seconds
+                    return info
+            finally:
+                cf.CFRelease(sources)
+        finally:
+            cf.CFRelease(blob)
+        return {}
+    
+    def _number(self, desc, key: str) -> Optional[int]:
+        value = self._cf.CFDictionaryGetValue(desc, self._keys[key])
+        if not value or self._cf.CFGetTypeID(value) != self._number_type:
+            return None
+        out = ctypes.c_int64()
+        if not self._cf.CFNumberGetValue(value, self._kCFNumberSInt64Type, ctypes.byref(out)):
+            return None
+        return out.value
+    
+    def _string(self, desc, key: str) -> Optional[str]:
+        value = self._cf.CFDictionaryGetValue(desc, self._keys[key])
+        if not value or self._cf.CFGetTypeID(value) != self._string_type:
+            return None
+        buf = ctypes.create_string_buffer(64)
+        if not self._cf.CFStringGetCString(value, buf, len(buf), self._kCFStringEncodingUTF8):
+            return None
+        return buf.value.decode()
 
 class SystemMonitor:
     """System monitoring class for battery, CPU, memory, and network information"""
@@ -26,101 +172,172 @@ class SystemMonitor:
         self._system_info = None
         self._monitoring = False
         self._monitor_thread = None
-        self._callbacks = []
+        # Replaced, never mutated, so the monitor thread can iterate it without a lock
+        self._callbacks = ()
+        self._last_snapshot = None
+        self._last_notify = 0.0
+        self._stop_event = threading.Event()
+        # Set by trigger() or stop_monitoring() to cut the current wait short
+        self._wake_event = threading.Event()
+        # Linux battery sysfs directory ('' when there is none) and its open attribute fds
+        self._linux_battery_dir = None
+        self._linux_fds = {}
+        # IOKit binding: None until first use, False when it could not be loaded
+        self._iokit_power = None
+        # (monotonic time, parsed info) of the last system_profiler run
+        self._macos_battery_cache = (0.0, None)
+        self._interval = 2.0
+        # Per-thread COM state; a WMI connection only works in the apartment that made it
+        self._com = threading.local()
+        if psutil:
+            # Prime the counters so the first non-blocking cpu_percent() is meaningful
+            psutil.cpu_percent(interval=None)
+            # Non-blocking: usage since the previous call, i.e. since the last tick
+            self._sample_cpu = lambda: psutil.cpu_percent(interval=None)
+            self._sample_mem = lambda: psutil.virtual_memory().percent
+            self._sample_netif = self._psutil_interface_names
+        else:
+            self._sample_cpu = self._sample_mem = lambda: 0.0
+            self._sample_netif = list
+        self._sample_battery = self._choose_battery_sampler()
+        self._get_platform_battery = {
+            "Windows": self._get_windows_battery_info,
+            "Linux": self._get_linux_battery_info,
+            "Darwin": self._get_macos_battery_info,
+        }.get(_PLATFORM_SYSTEM, dict)
     
-    def start_monitoring(self, callback=None, interval=2.0):
-        """Start system monitoring in background thread"""
-        if self._monitoring:
-            return
+    def start_monitoring(self, callback=None, interval=2.0, max_interval=MAX_MONITOR_INTERVAL):
+        """Start system monitoring in background thread
         
+        interval is the sampling period while readings change; it grows
+        towards max_interval while the system is steady.
+        """
         if callback:
-            self._callbacks.append(callback)
+            # Rebinding is atomic, so the running loop sees either the old or the new tuple
+            self._callbacks = self._callbacks + (callback,)
+        
+        if self._monitoring:
+            return
         
         self._monitoring = True
-        self._monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval,), daemon=True)
+        self._interval = interval
+        self._stop_event.clear()
+        self._monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval, max_interval), daemon=True)
         self._monitor_thread.start()
     
+    def remove_callback(self, callback):
+        """Stop notifying callback; takes effect from the next tick"""
+        self._callbacks = tuple(cb for cb in self._callbacks if cb is not callback)
+    
     def stop_monitoring(self):
         """Stop system monitoring"""
         self._monitoring = False
-        if self._monitor_thread:
-            self._monitor_thread.join(timeout=1.0)
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._monitor_thread
+        if thread:
+            thread.join(timeout=1.0)
             self._monitor_thread = None
+        # A thread still mid-sample closes the fds itself on the way out
+        if not (thread and thread.is_alive()):
+            self.close()
     
-    def _monitor_loop(self, interval):
+    def _monitor_loop(self, interval, max_interval):
         """Background monitoring loop"""
-        while self._monitoring:
+        # One COM apartment for the thread's lifetime so the WMI connection is reused
+        if pythoncom:
+            pythoncom.CoInitialize()
+            self._com.initialized = True
+        try:
+            self._run_monitor(interval, max_interval)
+        finally:
+            self.close()
+            if pythoncom:
+                self._com.wmi = None
+                self._com.initialized = False
+                pythoncom.CoUninitialize()
+    
+    def _run_monitor(self, interval, max_interval):
+        """Sample, notify and wait until stopped"""
+        interval = max(interval, MIN_MONITOR_INTERVAL)
+        max_interval = max(max_interval, interval)
+        current_interval = interval
+        previous = None
+        
+        while not self._stop_event.is_set():
             try:
-                system_info = self.get_system_info()
-                battery_info = self.get_battery_info()
+                # One battery query per tick, shared with the system snapshot
+                sampled, battery_info = self._read_battery()
+                system_info = self.get_system_info((sampled, battery_info))
                 
                 # Update cached info
                 self._system_info = system_info
                 self._battery_info = battery_info
                 
-                # Notify callbacks
-                for callback in self._callbacks:
-                    try:
-                        callback(system_info, battery_info)
-                    except Exception as e:
-                        print(f"Error in system monitor callback: {e}")
+                # Notify callbacks, unless the readings they display have not changed
+                snapshot = (round(system_info.cpu_usage, 1), round(system_info.memory_usage, 1),
+                            system_info.battery_percentage, system_info.battery_plugged)
+                now = time.monotonic()
+                # One read of the tuple per tick; registrations made meanwhile apply next tick
+                callbacks = self._callbacks
+                if callbacks and (snapshot != self._last_snapshot or now - self._last_notify >= _NOTIFY_MAX_SILENCE):
+                    self._last_snapshot = snapshot
+                    self._last_notify = now
+                    for callback in callbacks:
+                        try:
+                            callback(system_info, battery_info)
+                        except Exception as e:
+                            print(f"Error in system monitor callback: {e}")
                 
-                time.sleep(interval)
+                # Back off while nothing moves, return to the fast rate on any change
+                sample = (system_info.cpu_usage, system_info.memory_usage,
+                          system_info.battery_percentage, system_info.battery_plugged)
+                if previous is not None and self._is_steady(previous, sample):
+                    current_interval = min(current_interval * _INTERVAL_BACKOFF, max_interval)
+                else:
+                    current_interval = interval
+                previous = sample
             except Exception as e:
                 print(f"Error in system monitoring: {e}")
-                time.sleep(interval)
+            
+            # Sleep until the next tick, a trigger() or stop_monitoring()
+            if self._wake_event.wait(current_interval):
+                current_interval = interval
+            self._wake_event.clear()
+    
+    @staticmethod
+    def _is_steady(previous: tuple, sample: tuple) -> bool:
+        """True when CPU and memory stayed within tolerance and the battery state is unchanged"""
+        return (abs(sample[0] - previous[0]) < _STEADY_TOLERANCE and
+                abs(sample[1] - previous[1]) < _STEADY_TOLERANCE and
+                sample[2:] == previous[2:])
+    
+    def trigger(self):
+        """Take a fresh sample now instead of waiting for the next tick"""
+        self._wake_event.set()
     
-    def get_system_info(self) -> SystemInfo:
-        """Get current system information"""
+    def get_system_info(self, battery_reading: Optional[Tuple[Dict[str, Any], Dict[str, Any]]] = None) -> SystemInfo:
+        """Get current system information
+        
+        Pass the result of _read_battery() when it is already at hand to
+        avoid querying the battery twice.
+        """
         try:
-            # Basic system info
-            platform_name = platform.system()
-            platform_version = platform.platform()
-            architecture = platform.architecture()[0]
-            
-            # CPU and memory usage
-            cpu_usage = 0.0
-            memory_usage = 0.0
-            
-            if psutil:
-                cpu_usage = psutil.cpu_percent(interval=0.1)
-                memory = psutil.virtual_memory()
-                memory_usage = memory.percent
-            
-            # Network interfaces
-            network_interfaces = []
-            if psutil:
-                try:
-                    interfaces = psutil.net_if_addrs()
-                    network_interfaces = list(interfaces.keys())
-                except:
-                    pass
+            cpu_usage = self._sample_cpu()
+            memory_usage = self._sample_mem()
+            network_interfaces = self._sample_netif()
             
-            # Battery information
-            battery_percentage = None
-            battery_plugged = False
-            
-            if psutil and hasattr(psutil, 'sensors_battery'):
-                try:
-                    battery = psutil.sensors_battery()
-                    if battery:
-                        battery_percentage = int(battery.percent)
-                        battery_plugged = battery.power_plugged
-                except:
-                    pass
-            
-            # Fallback battery detection for different platforms
-            if battery_percentage is None:
-                battery_info = self.get_battery_info()
-                battery_percentage = battery_info.get('percentage')
-                battery_plugged = battery_info.get('plugged', False)
+            # Battery information: trust psutil, the platform reader is only a fallback
+            sampled, battery_info = battery_reading or self._read_battery()
+            if sampled.get('percentage') is None:
+                sampled = battery_info
             
             return SystemInfo(
-                platform=platform_name,
-                platform_version=platform_version,
-                architecture=architecture,
-                battery_percentage=battery_percentage,
-                battery_plugged=battery_plugged,
+                platform=_PLATFORM_SYSTEM,
+                platform_version=_PLATFORM_PLATFORM,
+                architecture=_PLATFORM_ARCH,
+                battery_percentage=sampled.get('percentage'),
+                battery_plugged=sampled.get('plugged', False),
                 cpu_usage=cpu_usage,
                 memory_usage=memory_usage,
                 network_interfaces=network_interfaces
@@ -129,13 +346,42 @@ class SystemMonitor:
         except Exception as e:
             print(f"Error getting system info: {e}")
             return SystemInfo(
-                platform=platform.system(),
-                platform_version=platform.platform(),
-                architecture=platform.architecture()[0] if platform.architecture() else "Unknown"
+                platform=_PLATFORM_SYSTEM,
+                platform_version=_PLATFORM_PLATFORM,
+                architecture=_PLATFORM_ARCH
             )
     
+    @staticmethod
+    def _psutil_interface_names() -> List[str]:
+        try:
+            return list(psutil.net_if_addrs())
+        except Exception:
+            return []
+    
+    @staticmethod
+    def _choose_battery_sampler():
+        """Pick the generic battery reader once; it returns a partial battery dict"""
+        if not (psutil and hasattr(psutil, 'sensors_battery')):
+            return dict
+        
+        def sample() -> Dict[str, Any]:
+            battery = psutil.sensors_battery()
+            if not battery:
+                return {}
+            info = {'percentage': int(battery.percent), 'plugged': battery.power_plugged}
+            if battery.secsleft != -1:
+                info['time_left'] = battery.secsleft
+            return info
+        
+        return sample
+    
     def get_battery_info(self) -> Dict[str, Any]:
         """Get detailed battery information"""
+        return self._read_battery()[1]
+    
+    def _read_battery(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Return the psutil reading on its own and merged with the platform details"""
+        sampled = {}
         battery_info = {
             'percentage': None,
             'plugged': False,
@@ -146,26 +392,16 @@ class SystemMonitor:
         }
         
         try:
-            if psutil and hasattr(psutil, 'sensors_battery'):
-                battery = psutil.sensors_battery()
-                if battery:
-                    battery_info['percentage'] = int(battery.percent)
-                    battery_info['plugged'] = battery.power_plugged
-                    if battery.secsleft != -1:
-                        battery_info['time_left'] = battery.secsleft
+            sampled = self._sample_battery()
+            battery_info.update(sampled)
             
             # Platform-specific battery detection
-            if platform.system() == "Windows":
-                battery_info.update(self._get_windows_battery_info())
-            elif platform.system() == "Linux":
-                battery_info.update(self._get_linux_battery_info())
-            elif platform.system() == "Darwin":
-                battery_info.update(self._get_macos_battery_info())
+            battery_info.update(self._get_platform_battery())
         
         except Exception as e:
             print(f"Error getting battery info: {e}")
         
-        return battery_info
+        return sampled, battery_info
     
     def _get_windows_battery_info(self) -> Dict[str, Any]:
         """Get Windows-specific battery information"""
@@ -173,12 +409,8 @@ class SystemMonitor:
         
         try:
             # Try using WMI for detailed battery info
-            if 'wmi' in globals() and wmi:
-                import pythoncom
-                pythoncom.CoInitialize()
-                c = wmi.WMI()
-                
-                for battery in c.Win32_Battery():
+            if wmi and pythoncom:
+                for battery in self._get_wmi().Win32_Battery():
                     if battery.EstimatedChargeRemaining is not None:
                         info['percentage'] = int(battery.EstimatedChargeRemaining)
                     if battery.BatteryStatus is not None:
@@ -189,168 +421,189 @@ class SystemMonitor:
                     if battery.Temperature is not None:
                         info['temperature'] = battery.Temperature
                     break
-                
-                pythoncom.CoUninitialize()
         
         except Exception as e:
             print(f"Windows battery detection error: {e}")
+            # Rebind on the next poll in case the connection went bad
+            self._com.wmi = None
         
         return info
     
+    def _get_wmi(self):
+        """Return this thread's WMI connection, initializing COM once per thread"""
+        if getattr(self._com, 'wmi', None) is None:
+            if not getattr(self._com, 'initialized', False):
+                pythoncom.CoInitialize()
+                self._com.initialized = True
+            self._com.wmi = wmi.WMI()
+        return self._com.wmi
+    
     def _get_linux_battery_info(self) -> Dict[str, Any]:
         """Get Linux-specific battery information"""
         info = {}
         
         try:
-            # Try reading from /sys/class/power_supply
-            import os
+            if not self._open_linux_battery():
+                return info
             
-            # Find battery directory
-            battery_dir = None
-            for item in os.listdir('/sys/class/power_supply/'):
-                if item.startswith('BAT'):
-                    battery_dir = f'/sys/class/power_supply/{item}'
-                    break
+            capacity = self._read_battery_int('capacity')
+            if capacity is not None:
+                info['percentage'] = capacity
             
-            if battery_dir:
-                # Read battery percentage
-                try:
-                    with open(f'{battery_dir}/capacity', 'r') as f:
-                        info['percentage'] = int(f.read().strip())
-                except:
-                    pass
-                
-                # Read power status
-                try:
-                    with open(f'{battery_dir}/status', 'r') as f:
-                        status = f.read().strip().lower()
-                        info['plugged'] = status in ['charging', 'full']
-                except:
-                    pass
-                
-                # Read time to empty/full
-                try:
-                    if info.get('plugged'):
-                        with open(f'{battery_dir}/time_to_full_now', 'r') as f:
-                            info['time_left'] = int(f.read().strip())
-                    else:
-                        with open(f'{battery_dir}/time_to_empty_now', 'r') as f:
-                            info['time_left'] = int(f.read().strip())
-                except:
-                    pass
-                
-                # Read power consumption
-                try:
-                    with open(f'{battery_dir}/power_now', 'r') as f:
-                        power_mw = int(f.read().strip())
-                        info['power_consumption'] = power_mw / 1000.0  # Convert to watts
-                except:
-                    pass
-                
-                # Read temperature
-                try:
-                    with open(f'{battery_dir}/temp', 'r') as f:
-                        temp_celsius = int(f.read().strip()) / 10.0  # Usually in 0.1°C units
-                        info['temperature'] = temp_celsius
-                except:
-                    pass
+            # Read power status
+            status = self._read_battery_attr('status')
+            if status is not None:
+                info['plugged'] = status in _LINUX_PLUGGED_STATUS
+            
+            # Read time to empty/full
+            time_left = self._read_battery_int('time_to_full_now' if info.get('plugged') else 'time_to_empty_now')
+            if time_left is not None:
+                info['time_left'] = time_left
+            
+            power_mw = self._read_battery_int('power_now')
+            if power_mw is not None:
+                info['power_consumption'] = power_mw / 1000.0  # Convert to watts
+            
+            temp = self._read_battery_int('temp')
+            if temp is not None:
+                info['temperature'] = temp / 10.0  # Usually in 0.1°C units
         
         except Exception as e:
             print(f"Linux battery detection error: {e}")
+            # The battery may have gone away; look it up again on the next poll
+            self._close_linux_battery()
         
         return info
     
+    def _open_linux_battery(self) -> bool:
+        """Find the first BAT* power supply once and keep its attribute fds open"""
+        if self._linux_battery_dir is None:
+            self._linux_battery_dir = ''
+            for item in os.listdir(_POWER_SUPPLY_DIR):
+                if item.startswith('BAT'):
+                    self._linux_battery_dir = f'{_POWER_SUPPLY_DIR}/{item}'
+                    break
+            
+            if self._linux_battery_dir:
+                for attr in _LINUX_BATTERY_ATTRS:
+                    try:
+                        self._linux_fds[attr] = os.open(f'{self._linux_battery_dir}/{attr}', os.O_RDONLY | os.O_CLOEXEC)
+                    except OSError:
+                        pass  # Not every driver exposes every attribute
+        
+        return bool(self._linux_fds)
+    
+    def _read_battery_attr(self, attr: str) -> Optional[bytes]:
+        fd = self._linux_fds.get(attr)
+        if fd is None:
+            return None
+        # Reading from offset 0 makes sysfs produce a fresh value each time
+        return os.pread(fd, 32, 0)
+    
+    def _read_battery_int(self, attr: str) -> Optional[int]:
+        raw = self._read_battery_attr(attr)
+        try:
+            return int(raw) if raw is not None else None
+        except ValueError:
+            return None
+    
+    def _close_linux_battery(self):
+        for fd in self._linux_fds.values():
+            os.close(fd)
+        self._linux_fds = {}
+        self._linux_battery_dir = None
+    
+    def close(self):
+        """Release cached battery file handles"""
+        self._close_linux_battery()
+    
     def _get_macos_battery_info(self) -> Dict[str, Any]:
         """Get macOS-specific battery information"""
+        if self._iokit_power is None:
+            try:
+                self._iokit_power = _IOKitPowerSources()
+            except (OSError, AttributeError) as e:
+                print(f"IOKit power source API unavailable, using system_profiler: {e}")
+                self._iokit_power = False
+        
+        if self._iokit_power:
+            try:
+                return self._iokit_power.read()
+            except Exception as e:
+                print(f"IOKit battery detection error: {e}")
+        
+        # Fallback: system_profiler takes hundreds of ms; reuse its answer for a few ticks
+        cached_at, cached_info = self._macos_battery_cache
+        if cached_info is not None and time.monotonic() - cached_at < max(self._interval, _MACOS_BATTERY_TTL):
+            return dict(cached_info)
+        
         info = {}
         
         try:
             # Use system_profiler for battery info
             result = subprocess.run(['system_profiler', 'SPPowerDataType'], 
-                                  capture_output=True, text=True, timeout=10)
+                                  capture_output=True, text=True, timeout=2)
             if result.returncode == 0:
-                lines = result.stdout.split('\n')
-                current_section = None
-                
-                for line in lines:
-                    line = line.strip()
-                    if 'Battery Information:' in line:
-                        current_section = 'battery'
-                    elif current_section == 'battery':
-                        if 'Charge Remaining (mAh):' in line:
-                            try:
-                                mah = int(line.split(':')[1].strip())
-                                # Estimate percentage (this is approximate)
-                                info['percentage'] = min(100, max(0, int(mah / 10)))
-                            except:
-                                pass
-                        elif 'Fully Charged:' in line:
-                            info['plugged'] = 'Yes' in line
-                        elif 'Time Remaining:' in line:
-                            time_str = line.split(':')[1].strip()
-                            if time_str != '0:00':
-                                # Parse time string (e.g., "2:30")
-                                try:
-                                    parts = time_str.split(':')
-                                    minutes = int(parts[0]) * 60 + int(parts[1])
-                                    info['time_left'] = minutes * 60  # Convert to seconds
-                                except:
-                                    pass
+                section = result.stdout.find('Battery Information:')
+                if section != -1:
+                    for m in _MACOS_BATTERY_RE.finditer(result.stdout, section):
+                        if m.group('mah') is not None:
+                            # Estimate percentage (this is approximate)
+                            info['percentage'] = min(100, max(0, int(m.group('mah')) // 10))
+                        elif m.group('charged') is not None:
+                            info['plugged'] = m.group('charged') == 'Yes'
+                        elif m.group('hours') is not None:
+                            minutes = int(m.group('hours')) * 60 + int(m.group('minutes'))
+                            if minutes:
+                                info['time_left'] = minutes * 60  # Convert to seconds
+                self._macos_battery_cache = (time.monotonic(), info)
         
         except Exception as e:
             print(f"macOS battery detection error: {e}")
         
-        return info
+        return dict(info)
     
     def get_network_info(self) -> Dict[str, Any]:
-        """Get network interface information"""
+        """Get network interface information
+        
+        'interfaces' is a NetIfTable; call its as_dict() for per-interface dicts.
+        """
         network_info = {
-            'interfaces': {},
+            'interfaces': NetIfTable(),
             'active_connections': [],
             'wireless_networks': []
         }
         
         try:
             if psutil:
-                # Get network interfaces
-                interfaces = psutil.net_if_addrs()
+                # One pass filling flat columns instead of a dict per interface and per address
+                table = NetIfTable()
                 interface_stats = psutil.net_if_stats()
-                
-                for interface_name, addresses in interfaces.items():
-                    interface_info = {
-                        'name': interface_name,
-                        'addresses': [],
-                        'status': 'unknown',
-                        'speed': None
-                    }
-                    
-                    # Get addresses
+                for interface_name, addresses in psutil.net_if_addrs().items():
+                    table.names.append(interface_name)
+                    stats = interface_stats.get(interface_name)
+                    table.is_up.append(stats.isup if stats else None)
+                    table.speeds.append(stats.speed if stats else None)
                     for addr in addresses:
-                        interface_info['addresses'].append({
-                            'family': str(addr.family),
-                            'address': addr.address,
-                            'netmask': addr.netmask,
-                            'broadcast': getattr(addr, 'broadcast', None)
-                        })
-                    
-                    # Get interface status
-                    if interface_name in interface_stats:
-                        stats = interface_stats[interface_name]
-                        interface_info['status'] = 'up' if stats.isup else 'down'
-                        interface_info['speed'] = stats.speed
-                    
-                    network_info['interfaces'][interface_name] = interface_info
+                        table.addr_families.append(addr.family)
+                        table.addr_addresses.append(addr.address)
+                        table.addr_netmasks.append(addr.netmask)
+                        table.addr_broadcasts.append(getattr(addr, 'broadcast', None))
+                    table.addr_starts.append(len(table.addr_addresses))
+                network_info['interfaces'] = table
                 
-                # Get active connections
-                connections = psutil.net_connections()
-                for conn in connections:
-                    if conn.status == 'ESTABLISHED':
-                        network_info['active_connections'].append({
-                            'local_address': f"{conn.laddr.ip}:{conn.laddr.port}",
-                            'remote_address': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
-                            'status': conn.status,
-                            'pid': conn.pid
-                        })
+                # Established connections only exist for TCP, so skip enumerating UDP/UNIX sockets.
+                # Without admin rights psutil only sees this user's sockets (or raises AccessDenied).
+                network_info['active_connections'] = [
+                    {
+                        'local_address': f"{conn.laddr.ip}:{conn.laddr.port}",
+                        'remote_address': f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else None,
+                        'status': conn.status,
+                        'pid': conn.pid
+                    }
+                    for conn in psutil.net_connections(kind='tcp')
+                    if conn.status == psutil.CONN_ESTABLISHED
+                ]
         
         except Exception as e:
             print(f"Error getting network info: {e}")